@@ -1,12 +1,42 @@
 import fitz  # PyMuPDF
-import json
-import os
-from datetime import datetime
+import time
 import logging
+import functools
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
-# Configure logging
-logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('pdf_annotations')
+logger = logging.getLogger(__name__)
+
+_DEFAULT_USERNAME = "Kullanıcı"
+
+# Shared RGB color tuples (0-1 range) used as annotation defaults
+_YELLOW = (1.0, 1.0, 0.0)
+_RED = (1.0, 0.0, 0.0)
+_BLACK = (0.0, 0.0, 0.0)
+_last_ts_sec = 0
+_last_ts_str = ""
+
+def _now_str():
+    """Returns the current local time formatted for annotation titles, cached per second."""
+    global _last_ts_sec, _last_ts_str
+    s = int(time.time())
+    if s != _last_ts_sec:
+        _last_ts_str = time.strftime("%d.%m.%Y, %H:%M:%S", time.localtime(s))
+        _last_ts_sec = s
+    return _last_ts_str
+
+def _locked(method):
+    """Runs a PDFAnnotations method while holding the document lock, see PDFHandler.doc_lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.pdf_handler.doc_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _norm_rect(x0, y0, x1, y1):
+    """Returns (x0, y0, x1, y1) with x0 <= x1 and y0 <= y1, e.g. for rects dragged up/left."""
+    return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
 
 class PDFAnnotations:
     """Handles PDF annotations such as notes, highlights, etc."""
@@ -18,145 +48,253 @@ class PDFAnnotations:
             pdf_handler: The PDFHandler instance containing the document.
         """
         self.pdf_handler = pdf_handler
-        self.annotations = {}  # Dictionary to store annotations by page
+        self._pending_updates = defaultdict(list)  # page -> [(annot, update kwargs)] waiting for flush()
+        self._pc = pdf_handler.page_count  # Cached page count, refreshed by invalidate_pages()
+        # Annotation type -> raw helper taking (page, x0, y0, x1, y1, **options)
+        self._dispatch = {
+            "note": lambda page, x0, y0, x1, y1, **kw: self._add_note_raw(page, x0, y0, **kw),
+            "text": self._add_text_raw,
+            "line": self._add_line_raw,
+            "circle": self._add_circle_raw,
+            "highlight": self._add_highlight_raw,
+            "stamp": self._add_stamp_raw,
+        }
+
+    def invalidate_pages(self):
+        """Refreshes the cached page count; must be called when pages are inserted, deleted or moved.
+
+        Deferred updates are dropped: PyMuPDF orphans loaded pages and their
+        annotations when the page structure changes, so they can't be applied.
+        """
+        self._pc = self.pdf_handler.page_count
+        if self._pending_updates:
+            logger.warning("Dropping deferred annotation updates on %d page(s) after a page change",
+                           len(self._pending_updates))
+            self._pending_updates.clear()
+
+    def _commit(self, page, annot, defer_update, **update_kwargs):
+        """Regenerates the appearance stream now, or queues it for flush()."""
+        if defer_update:
+            self._pending_updates[page].append((annot, update_kwargs))
+        else:
+            annot.update(**update_kwargs)
+            self.pdf_handler.invalidate_pixmaps(page.number)
+            self.pdf_handler.modified = True
+
+    @_locked
+    def flush(self):
+        """Applies all deferred annotation updates in a single pass."""
+        if not self._pending_updates:
+            return
+        # Applied serially on purpose: PyMuPDF documents and pages share one
+        # MuPDF context and must not be used from several threads at once.
+        try:
+            for page, pending in self._pending_updates.items():
+                for annot, update_kwargs in pending:
+                    try:
+                        annot.update(**update_kwargs)
+                    except Exception:
+                        logger.exception("Error applying deferred annotation update")
+                self.pdf_handler.invalidate_pixmaps(page.number)
+        finally:
+            self._pending_updates.clear() # A failed entry must not fail every later flush
+        self.pdf_handler.modified = True
+
+    # --- Raw helpers: take a loaded page and plain floats, no Qt types ---
+    def _add_note_raw(self, page, x, y, content, username=None, color=_YELLOW, defer_update=False):
+        title = "%s %s" % (username or _DEFAULT_USERNAME, _now_str())
+        annot = page.add_text_annot(fitz.Point(x, y), content, icon="Comment")
+        annot.set_info(title=title, content=content)
+        annot.set_colors(stroke=color)
+        self._commit(page, annot, defer_update)
+        return annot
+
+    def _add_text_raw(self, page, x0, y0, x1, y1, content, fontsize=12, color=_BLACK, fontname="helv", defer_update=False):
+        annot = page.add_freetext_annot(fitz.Rect(*_norm_rect(x0, y0, x1, y1)), content, fontsize=fontsize, text_color=color, fontname=fontname)
+        self._commit(page, annot, defer_update, fontname=fontname)
+        return annot
+
+    def _add_line_raw(self, page, x0, y0, x1, y1, color=_RED, width=1, arrow_type="none", defer_update=False):
+        # Use polyline for better compatibility with set_vertices/movement
+        annot = page.add_polyline_annot([fitz.Point(x0, y0), fitz.Point(x1, y1)])
+        annot.set_colors(stroke=color)
+        annot.set_border(width=width)
+
+        # Map arrow types to fitz constants. A new polyline has no line ends,
+        # so "none" needs no extra call before the single update below.
+        if arrow_type == "start":
+            annot.set_line_ends(fitz.PDF_ANNOT_LE_CLOSED_ARROW, fitz.PDF_ANNOT_LE_NONE)
+        elif arrow_type == "end":
+            annot.set_line_ends(fitz.PDF_ANNOT_LE_NONE, fitz.PDF_ANNOT_LE_CLOSED_ARROW)
+        elif arrow_type == "both":
+            annot.set_line_ends(fitz.PDF_ANNOT_LE_CLOSED_ARROW, fitz.PDF_ANNOT_LE_CLOSED_ARROW)
+
+        self._commit(page, annot, defer_update)
+        return annot
+
+    def _add_circle_raw(self, page, x0, y0, x1, y1, color=_RED, fill_color=None, width=2.0, defer_update=False):
+        annot = page.add_circle_annot(fitz.Rect(*_norm_rect(x0, y0, x1, y1)))
+        annot.set_colors(stroke=color, fill=fill_color)
+        annot.set_border(width=width)
+        self._commit(page, annot, defer_update)
+        return annot
 
-    def add_note(self, page_index, rect, content, username=None, color=(1, 1, 0)):
+    def _add_highlight_raw(self, page, x0, y0, x1, y1, color=_YELLOW, defer_update=False):
+        annot = page.add_highlight_annot(fitz.Rect(*_norm_rect(x0, y0, x1, y1)))
+        annot.set_colors(stroke=color)
+        self._commit(page, annot, defer_update)
+        return annot
+
+    def _add_stamp_raw(self, page, x0, y0, x1, y1, stamp_index=0, defer_update=False):
+        annot = page.add_stamp_annot(fitz.Rect(*_norm_rect(x0, y0, x1, y1)), stamp=stamp_index)
+        self._commit(page, annot, defer_update)
+        return annot
+
+    @_locked
+    def add_note(self, page_index, rect, content, username=None, color=_YELLOW, defer_update=False):
         """Add a sticky note (text) annotation to the PDF."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return None
 
         try:
-            page = self.pdf_handler.doc[page_index]
-            timestamp = datetime.now().strftime("%d.%m.%Y, %H:%M:%S")
-            title = f"{username or 'Kullanıcı'} {timestamp}"
-            
-            point = fitz.Point(rect.x(), rect.y())
-            annot = page.add_text_annot(point, content, icon="Comment")
-            annot.set_info(title=title, content=content)
-            annot.set_colors(stroke=color)
-            annot.update()
-            
-            self.pdf_handler.modified = True
-            return annot
-        except Exception as e:
-            logger.error(f"Error adding note annotation: {e}")
+            page = self.pdf_handler.get_page(page_index)
+            return self._add_note_raw(page, rect.x(), rect.y(), content, username, color, defer_update)
+        except Exception:
+            logger.exception("Error adding note annotation")
             return None
 
-    def add_text_annotation(self, page_index, rect, content, fontsize=12, color=(0, 0, 0), fontname="helv"):
+    @_locked
+    def add_text_annotation(self, page_index, rect, content, fontsize=12, color=_BLACK, fontname="helv", defer_update=False):
         """Add a FreeText annotation (visible text on page)."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return None
         try:
-            page = self.pdf_handler.doc[page_index]
-            fitz_rect = fitz.Rect(rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height())
-            
-            annot = page.add_freetext_annot(fitz_rect, content, fontsize=fontsize, text_color=color, fontname=fontname)
-            annot.update(fontname=fontname)
-            
-            self.pdf_handler.modified = True
-            return annot
-        except Exception as e:
-            logger.error(f"Error adding text annotation: {e}")
+            page = self.pdf_handler.get_page(page_index)
+            rx, ry, rw, rh = rect.x(), rect.y(), rect.width(), rect.height()
+            return self._add_text_raw(page, rx, ry, rx + rw, ry + rh, content, fontsize, color, fontname, defer_update)
+        except Exception:
+            logger.exception("Error adding text annotation")
             return None
 
-    def add_line_annotation(self, page_index, start_point, end_point, color=(1, 0, 0), width=1, arrow_type="none"):
+    @_locked
+    def add_line_annotation(self, page_index, start_point, end_point, color=_RED, width=1, arrow_type="none", defer_update=False):
         """Adds a line (as a polyline) annotation to the given page."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return None
         try:
-            page = self.pdf_handler.doc[page_index]
-            p1 = fitz.Point(start_point.x(), start_point.y())
-            p2 = fitz.Point(end_point.x(), end_point.y())
-            
-            # Use polyline for better compatibility with set_vertices/movement
-            annot = page.add_polyline_annot([p1, p2])
-            annot.set_colors(stroke=color)
-            annot.set_border(width=width)
-            
-            # Map arrow types to fitz constants
-            if arrow_type == "start":
-                annot.set_line_ends(fitz.PDF_ANNOT_LE_CLOSED_ARROW, fitz.PDF_ANNOT_LE_NONE)
-            elif arrow_type == "end":
-                annot.set_line_ends(fitz.PDF_ANNOT_LE_NONE, fitz.PDF_ANNOT_LE_CLOSED_ARROW)
-            elif arrow_type == "both":
-                annot.set_line_ends(fitz.PDF_ANNOT_LE_CLOSED_ARROW, fitz.PDF_ANNOT_LE_CLOSED_ARROW)
-            else:
-                annot.set_line_ends(fitz.PDF_ANNOT_LE_NONE, fitz.PDF_ANNOT_LE_NONE)
-            
-            annot.update()
-            
-            self.pdf_handler.modified = True
-            return annot
-        except Exception as e:
-            logger.error(f"Error adding line annotation: {e}")
+            page = self.pdf_handler.get_page(page_index)
+            return self._add_line_raw(page, start_point.x(), start_point.y(), end_point.x(), end_point.y(),
+                                      color, width, arrow_type, defer_update)
+        except Exception:
+            logger.exception("Error adding line annotation")
             return None
 
-    def add_circle_annotation(self, page_index, rect, color=(1, 0, 0), fill_color=None, width=2.0):
+    @_locked
+    def add_circle_annotation(self, page_index, rect, color=_RED, fill_color=None, width=2.0, defer_update=False):
         """Add a circle (ellipse) annotation."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return None
         try:
-            page = self.pdf_handler.doc[page_index]
-            fitz_rect = fitz.Rect(rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height())
-            
-            annot = page.add_circle_annot(fitz_rect)
-            annot.set_colors(stroke=color, fill=fill_color)
-            annot.set_border(width=width)
-            annot.update()
-            
-            self.pdf_handler.modified = True
-            return annot
-        except Exception as e:
-            logger.error(f"Error adding circle annotation: {e}")
+            page = self.pdf_handler.get_page(page_index)
+            rx, ry, rw, rh = rect.x(), rect.y(), rect.width(), rect.height()
+            return self._add_circle_raw(page, rx, ry, rx + rw, ry + rh, color, fill_color, width, defer_update)
+        except Exception:
+            logger.exception("Error adding circle annotation")
             return None
 
-    def add_highlight_annotation(self, page_index, rect, color=(1, 1, 0)):
+    @_locked
+    def add_highlight_annotation(self, page_index, rect, color=_YELLOW, defer_update=False):
         """Add a highlight annotation."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return None
         try:
-            page = self.pdf_handler.doc[page_index]
-            fitz_rect = fitz.Rect(rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height())
-            
-            annot = page.add_highlight_annot(fitz_rect)
-            annot.set_colors(stroke=color)
-            annot.update()
-            
-            self.pdf_handler.modified = True
-            return annot
-        except Exception as e:
-            logger.error(f"Error adding highlight annotation: {e}")
+            page = self.pdf_handler.get_page(page_index)
+            rx, ry, rw, rh = rect.x(), rect.y(), rect.width(), rect.height()
+            return self._add_highlight_raw(page, rx, ry, rx + rw, ry + rh, color, defer_update)
+        except Exception:
+            logger.exception("Error adding highlight annotation")
             return None
 
-    def add_stamp_annotation(self, page_index, rect, stamp_index=0):
+    @_locked
+    def add_stamp_annotation(self, page_index, rect, stamp_index=0, defer_update=False):
         """Add a stamp annotation."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return None
         try:
-            page = self.pdf_handler.doc[page_index]
-            fitz_rect = fitz.Rect(rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height())
-            
-            annot = page.add_stamp_annot(fitz_rect, stamp=stamp_index)
-            annot.update()
-            
-            self.pdf_handler.modified = True
-            return annot
-        except Exception as e:
-            logger.error(f"Error adding stamp annotation: {e}")
+            page = self.pdf_handler.get_page(page_index)
+            rx, ry, rw, rh = rect.x(), rect.y(), rect.width(), rect.height()
+            return self._add_stamp_raw(page, rx, ry, rx + rw, ry + rh, stamp_index, defer_update)
+        except Exception:
+            logger.exception("Error adding stamp annotation")
             return None
 
+    @_locked
+    def add_annotations(self, records):
+        """Add many annotations at once, loading each page only once.
+
+        Args:
+            records: Iterable of dicts with "page" (0-based index), "type"
+                (note, text, line, circle, highlight or stamp) and "rect"
+                (x0, y0, x1, y1 in PDF units; a line goes from (x0, y0) to
+                (x1, y1), a note is placed at (x0, y0)). Any other keys are
+                passed as options to the matching add_* method, e.g.
+                "content", "color", "width".
+
+        Returns:
+            The number of annotations that were added.
+        """
+        added = 0
+        key = itemgetter("page")
+        for page_index, group in groupby(sorted(records, key=key), key=key):
+            if not (0 <= page_index < self._pc):
+                logger.warning("Skipping annotations for invalid page %s", page_index)
+                continue
+            page = self.pdf_handler.get_page(page_index)
+            for record in group:
+                try:
+                    options = {k: v for k, v in record.items() if k not in ("page", "type", "rect")}
+                    self._dispatch[record["type"]](page, *record["rect"], defer_update=True, **options)
+                    added += 1
+                except Exception:
+                    logger.exception("Error adding %s annotation on page %s", record.get("type"), page_index)
+        self.flush()
+        return added
+
+    @_locked
     def remove_annotation(self, page_index, annot_index):
         """Remove an annotation from the PDF by its index on the page."""
-        if not self.pdf_handler.doc or not (0 <= page_index < self.pdf_handler.page_count):
+        if not (0 <= page_index < self._pc):
             return False
         try:
-            page = self.pdf_handler.doc[page_index]
-            annots = list(page.annots())
-            if 0 <= annot_index < len(annots):
-                page.delete_annot(annots[annot_index])
-                self.pdf_handler.modified = True
-                return True
+            if annot_index < 0:
+                return False
+            page = self.pdf_handler.get_page(page_index)
+            # Walk the annotation list only up to the requested index
+            for i, annot in enumerate(page.annots()):
+                if i == annot_index:
+                    page.delete_annot(annot)
+                    self.pdf_handler.invalidate_pixmaps(page_index)
+                    self.pdf_handler.modified = True
+                    return True
+            return False
+        except Exception:
+            logger.exception("Error removing annotation")
             return False
-        except Exception as e:
-            logger.error(f"Error removing annotation: {e}")
+
+    @_locked
+    def remove_annotation_by_xref(self, page_index, xref):
+        """Remove an annotation from the PDF by its xref (see fitz.Annot.xref)."""
+        if not (0 <= page_index < self._pc):
+            return False
+        try:
+            page = self.pdf_handler.get_page(page_index)
+            annot = page.load_annot(xref)
+            if annot is None:
+                return False
+            page.delete_annot(annot)
+            self.pdf_handler.invalidate_pixmaps(page_index)
+            self.pdf_handler.modified = True
+            return True
+        except Exception:
+            logger.exception("Error removing annotation")
             return False
@@ -1,10 +1,100 @@
 import fitz  # PyMuPDF
 import os
+import logging
+import multiprocessing
+import threading
+from collections import OrderedDict
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from core.pdf_annotations import PDFAnnotations
 
+logger = logging.getLogger(__name__)
+
+_PAGE_CACHE_MAX = 32 # Loaded fitz.Page objects kept by get_page
+_PIX_CACHE_MAX = 32 # Rendered pages kept by get_page_pixmap
+_PIX_CACHE_MAX_BYTES = 128 * 1024 * 1024 # ...and the memory they may use together
+_DL_CACHE_MAX = 8 # Parsed pages (display lists) kept for re-rendering at other zoom levels
+_STORE_SHRINK_EVERY = _PIX_CACHE_MAX # Trim MuPDF's resource store once the pixmap cache has turned over
+# Options for saves that rewrite the whole file: drop unused objects, merge
+# duplicates and compress. Renumbers xrefs, see _drop_document_caches.
+_FULL_SAVE_OPTS = {"garbage": 3, "deflate": True}
+# Each split worker process imports PyQt6 and PyMuPDF and re-opens the source
+# document before writing anything, so a pool only pays off for large splits
+_SPLIT_POOL_MIN_PAGES = 200
+# Rendering a page is far slower than copying it, so exports need fewer pages
+_EXPORT_POOL_MIN_PAGES = 16
+
+def _save_split_part(new_doc: fitz.Document, output_filename: str):
+    """Writes one part produced by split_pdf."""
+    # A freshly assembled document has nothing to garbage-collect or clean,
+    # so skip those passes; deflate only touches streams that aren't compressed yet
+    new_doc.save(output_filename, garbage=0, clean=False, deflate=True)
+
+def _save_page_image(doc: fitz.Document, page_num: int, filepath: str, matrix: fitz.Matrix, image_format: str):
+    """Renders one page and writes it with MuPDF's own encoders (no Pillow round trip)."""
+    pix = doc[page_num].get_pixmap(matrix=matrix, alpha=False)
+    if image_format in ("jpg", "jpeg"):
+        pix.save(filepath, output="jpeg", jpg_quality=85)
+    else:
+        pix.save(filepath, output=image_format)
+
+_worker_doc: fitz.Document | None = None # Source document inside a split/export worker process
+
+def _init_worker_doc(source: str | bytes):
+    """Pool initializer: opens the source PDF once per worker process."""
+    global _worker_doc
+    if isinstance(source, bytes):
+        _worker_doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        _worker_doc = fitz.open(source)
+
+def _export_one(job: tuple[int, str, float, str]) -> str | None:
+    """Saves page job[0] of the worker's source PDF as an image; returns an error message or None."""
+    page_num, filepath, zoom, image_format = job
+    try:
+        _save_page_image(_worker_doc, page_num, filepath, fitz.Matrix(zoom, zoom), image_format)
+        return None
+    except Exception as e:
+        return str(e)
+
+def _split_one(job: tuple[int, int, str]):
+    """Writes pages job[0]..job[1] of the worker's source PDF to job[2]."""
+    start_page, end_page, output_filename = job
+    with fitz.open() as new_doc:
+        new_doc.insert_pdf(_worker_doc, from_page=start_page, to_page=end_page)
+        _save_split_part(new_doc, output_filename)
+
+def _pixmap_bytes(qpixmap: QPixmap) -> int:
+    """Approximate memory used by a pixmap (4 bytes per pixel)."""
+    return qpixmap.width() * qpixmap.height() * 4
+
+class _RenderSignals(QObject):
+    finished = pyqtSignal(QImage, int) # image (null on failure), generation
+
+class _RenderTask(QRunnable):
+    """Rasterizes one page off the GUI thread for PDFHandler.render_page_async."""
+
+    def __init__(self, handler, page_num: int, scale: float, rotation: int, generation: int):
+        super().__init__()
+        self.handler = handler
+        self.page_num = page_num
+        self.scale = scale
+        self.rotation = rotation
+        self.generation = generation
+        self.signals = _RenderSignals()
+
+    def run(self):
+        image = QImage()
+        try:
+            rendered = self.handler._render_image(self.page_num, self.scale, self.rotation)
+            if rendered is not None:
+                img, pix = rendered
+                image = img.copy() # Detach from the MuPDF buffer before pix goes away
+        except Exception as e:
+            logger.error("Error rendering page %d in background: %s", self.page_num, e)
+        self.signals.finished.emit(image, self.generation)
+
 class PDFHandler:
     """Handles PDF document loading, manipulation, and rendering."""
 
@@ -12,13 +102,29 @@ class PDFHandler:
         self.doc: fitz.Document | None = None
         self.filepath: str | None = None
         self.modified: bool = False # Track if changes have been made
-        self.annotations = None # Will be initialized when a document is opened
-
-    def open_document(self, filepath: str) -> bool:
+        self._annotations: PDFAnnotations | None = None # Created on first use, see the annotations property
+        self._page_count = 0 # Cached doc.page_count, refreshed by _on_structure_changed
+        self._doc_lock = threading.RLock() # Serializes access to self.doc; reentrant so locked methods can nest
+        self._render_tasks: set[_RenderTask] = set() # Keeps pending async renders alive
+        self._render_pending: set[tuple] = set() # Cache keys of renders in flight
+        self._render_pool = QThreadPool()
+        self._render_pool.setMaxThreadCount(2) # Renders are serialized on _doc_lock anyway
+        self._render_generation = 0 # Bumped whenever renders in flight become stale
+        self._page_cache: OrderedDict[int, fitz.Page] = OrderedDict() # page_num -> loaded page, LRU order
+        self._pix_cache: OrderedDict[tuple, QPixmap] = OrderedDict() # (page, scale, rotation) -> QPixmap, LRU order
+        self._pix_cache_bytes = 0 # Approximate memory held by _pix_cache
+        self._pix_evictions = 0
+        self._matrix_cache: dict[tuple[float, int], fitz.Matrix] = {} # (scale, rotation) -> render matrix
+        self._dl_cache: OrderedDict[int, fitz.DisplayList] = OrderedDict() # page_num -> display list, LRU order
+
+    def open_document(self, filepath: str, stream: bytes | None = None) -> bool:
         """Opens a PDF document.
 
         Args:
             filepath: The path to the PDF file.
+            stream: Optional PDF data already in memory (e.g. downloaded). When
+                    given, the document is read from it and filepath is only
+                    used as the path to save to.
 
         Returns:
             True if the document was opened successfully, False otherwise.
@@ -26,128 +132,369 @@ class PDFHandler:
         if self.doc:
             self.close_document() # Close previous document if any
 
-        try:
-            self.doc = fitz.open(filepath)
-            self.filepath = filepath
-            self.modified = False
-            
-            # Initialize annotations handler
-            self.annotations = PDFAnnotations(self)
-            
-            return True
-        except Exception as e:
-            print(f"Error opening PDF {filepath}: {e}")
-            self.doc = None
-            self.filepath = None
-            self.annotations = None
-            return False
-
-    def close_document(self):
-        """Closes the currently open PDF document."""
-        if self.doc:
+        with self._doc_lock:
             try:
-                self.doc.close()
+                if stream is not None:
+                    self.doc = fitz.open(stream=stream, filetype="pdf")
+                else:
+                    self.doc = fitz.open(filepath)
+                self.filepath = filepath
+                self._page_count = self.doc.page_count
+                self.modified = False
+                return True
             except Exception as e:
-                print(f"Error closing PDF {self.filepath}: {e}")
-            finally:
+                logger.error("Error opening PDF %s: %s", filepath, e)
                 self.doc = None
                 self.filepath = None
-                self.annotations = None
-                self.modified = False
+                self._annotations = None
+                return False
+
+    def close_document(self):
+        """Closes the currently open PDF document."""
+        if self.doc:
+            # Waits for a background render to finish; a queued one then sees no document
+            with self._doc_lock:
+                try:
+                    self.doc.close()
+                except Exception as e:
+                    logger.error("Error closing PDF %s: %s", self.filepath, e)
+                finally:
+                    self.doc = None
+                    self.filepath = None
+                    self._annotations = None
+                    self._page_count = 0
+                    self.modified = False
+                    self._drop_document_caches() # Also releases fonts/images MuPDF cached for this document
+
+    @property
+    def doc_lock(self) -> threading.RLock:
+        """Lock to hold around any use of doc, its pages or their annotations.
+
+        PyMuPDF is not thread-safe and pages are rendered on worker threads,
+        so callers outside this class (annotation handler, viewer) take it too.
+        """
+        return self._doc_lock
+
+    @property
+    def annotations(self) -> PDFAnnotations | None:
+        """The annotations handler for the open document, created on first access."""
+        if self._annotations is None and self.doc:
+            self._annotations = PDFAnnotations(self)
+        return self._annotations
+
+    def _on_structure_changed(self):
+        """Drops page-indexed caches after pages were inserted, deleted or moved."""
+        with self._doc_lock: # get_page reads the count and the page cache on worker threads
+            self._page_count = self.doc.page_count
+            self.invalidate_pixmaps()
+            self._page_cache.clear()
+            if self._annotations:
+                self._annotations.invalidate_pages()
+
+    def invalidate_pixmaps(self, page_num: int | list[int] | None = None):
+        """Drops cached renderings of page_num (a page, a list of pages, or all pages) after their content changed."""
+        self._render_generation += 1
+        if page_num is None:
+            self._pix_cache.clear()
+            self._pix_cache_bytes = 0
+            with self._doc_lock: # A background render may be using the display lists
+                self._dl_cache.clear()
+            return
+        pages = {page_num} if isinstance(page_num, int) else set(page_num)
+        for key in [k for k in self._pix_cache if k[0] in pages]:
+            self._pix_cache_bytes -= _pixmap_bytes(self._pix_cache.pop(key))
+        with self._doc_lock:
+            for page in pages:
+                self._dl_cache.pop(page, None)
 
     @property
     def page_count(self) -> int:
         """Returns the number of pages in the document."""
-        return self.doc.page_count if self.doc else 0
+        return self._page_count
 
     def get_page(self, page_num: int) -> fitz.Page | None:
         """Returns the specified page object."""
-        if self.doc and 0 <= page_num < self.page_count:
-            try:
-                return self.doc.load_page(page_num)
-            except Exception as e:
-                print(f"Error loading page {page_num}: {e}")
-                return None
-        return None
+        with self._doc_lock:
+            doc = self.doc
+            if doc and 0 <= page_num < self._page_count:
+                page = self._page_cache.get(page_num)
+                if page is not None:
+                    self._page_cache.move_to_end(page_num)
+                    return page
+                try:
+                    page = self._page_cache[page_num] = doc[page_num]
+                    if len(self._page_cache) > _PAGE_CACHE_MAX:
+                        self._page_cache.popitem(last=False)
+                    return page
+                except Exception as e:
+                    logger.error("Error loading page %d: %s", page_num, e)
+                    return None
+            return None
+
+    def _render_matrix(self, scale: float, rotation: int) -> fitz.Matrix:
+        """Returns the (shared, do not modify) zoom + rotation matrix for rendering."""
+        if scale == 1 and not rotation:
+            return fitz.Identity
+        key = (scale, rotation)
+        matrix = self._matrix_cache.get(key)
+        if matrix is None:
+            matrix = fitz.Matrix(scale, scale)
+            if rotation:
+                matrix.prerotate(rotation)
+            if len(self._matrix_cache) >= 64: # Free zooming produces arbitrary scales
+                self._matrix_cache.clear()
+            self._matrix_cache[key] = matrix
+        return matrix
+
+    def _render_image(self, page_num: int, scale: float, rotation: int,
+                      use_cache: bool = True) -> tuple[QImage, fitz.Pixmap] | None:
+        """Rasterizes a page. Safe to call from a worker thread.
+
+        With use_cache False a page without a cached display list is rendered
+        directly, without adding one to the cache.
 
-    def get_page_pixmap(self, page_num: int, scale: float = 1.0, rotation: int = 0) -> QPixmap | None:
+        Returns:
+            (image, pix): image wraps pix's samples without copying, so pix must
+            be kept alive for as long as image is used. None if the page is invalid.
+        """
+        with self._doc_lock:
+            page = self.get_page(page_num)
+            if not page:
+                return None
+            # Interpreting the page's content stream is the expensive part; a cached
+            # display list replays it at any zoom without parsing the page again
+            matrix = self._render_matrix(scale, (page.rotation + rotation) % 360)
+            dl = self._dl_cache.get(page_num)
+            if dl is not None:
+                if use_cache:
+                    self._dl_cache.move_to_end(page_num)
+                pix = dl.get_pixmap(matrix=matrix, alpha=False)
+            elif use_cache:
+                dl = self._dl_cache[page_num] = page.get_displaylist()
+                if len(self._dl_cache) > _DL_CACHE_MAX:
+                    self._dl_cache.popitem(last=False)
+                pix = dl.get_pixmap(matrix=matrix, alpha=False)
+            else:
+                pix = page.get_pixmap(matrix=matrix, alpha=False)
+        # samples_mv exposes the MuPDF buffer without the bytes copy pix.samples makes
+        return QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888), pix
+
+    def _cache_pixmap(self, key: tuple, qpixmap: QPixmap):
+        """Stores a rendered page, evicting least recently used ones while the cache is over budget."""
+        old = self._pix_cache.pop(key, None)
+        if old is not None:
+            self._pix_cache_bytes -= _pixmap_bytes(old)
+        self._pix_cache[key] = qpixmap
+        self._pix_cache_bytes += _pixmap_bytes(qpixmap)
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while len(self._pix_cache) > 1 and (len(self._pix_cache) > _PIX_CACHE_MAX
+                                            or self._pix_cache_bytes > _PIX_CACHE_MAX_BYTES):
+            _, evicted = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= _pixmap_bytes(evicted)
+            self._pix_evictions += 1
+            if self._pix_evictions % _STORE_SHRINK_EVERY == 0:
+                with self._doc_lock: # The store is shared with a render in progress
+                    fitz.TOOLS.store_shrink(50)
+
+    def get_page_pixmap(self, page_num: int, scale: float = 1.0, rotation: int = 0,
+                        use_cache: bool = True) -> QPixmap | None:
         """Renders a page to a QPixmap.
 
         Args:
             page_num: The page number (0-indexed).
             scale: The scaling factor for rendering.
-            rotation: The rotation angle (0, 90, 180, 270).
+            rotation: Extra rotation (0, 90, 180, 270) applied on top of the
+                      page's own rotation.
+            use_cache: False renders without reading or filling the pixmap and
+                       display list caches, e.g. for thumbnails, so a pass over
+                       many pages doesn't evict the pages the viewer is using.
 
         Returns:
             A QPixmap of the rendered page, or None on error.
         """
-        page = self.get_page(page_num)
-        if page:
-            try:
-                zoom_matrix = fitz.Matrix(scale, scale)
-                rotation_matrix = fitz.Matrix(1, 1).prerotate(page.rotation)
-                combined_matrix = zoom_matrix * rotation_matrix
+        key = (page_num, round(scale, 3), rotation)
+        cached = self._pix_cache.get(key) if use_cache else None
+        if cached is not None:
+            self._pix_cache.move_to_end(key)
+            return cached
+
+        try:
+            rendered = self._render_image(page_num, scale, rotation, use_cache)
+            if rendered is None:
+                return None
+            img, pix = rendered
+            # fromImage makes a deep copy, so pix may be released right after
+            qpixmap = QPixmap.fromImage(img)
+            img = pix = rendered = None # Drop the MuPDF pixmap now rather than at function exit
+            if use_cache:
+                self._cache_pixmap(key, qpixmap)
+            return qpixmap
+        except Exception as e:
+            logger.error("Error getting pixmap for page %d: %s", page_num, e)
+            return None
 
-                pix = page.get_pixmap(matrix=combined_matrix, alpha=False)
+    def get_page_qimage(self, page_num: int, scale: float = 1.0, rotation: int = 0) -> QImage | None:
+        """Renders a page to a QImage that shares MuPDF's pixel buffer (no copy).
 
-                # Convert fitz.Pixmap to QImage to QPixmap
-                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                qpixmap = QPixmap.fromImage(img)
-                return qpixmap
-            except Exception as e:
-                print(f"Error getting pixmap for page {page_num}: {e}")
+        Meant for one-off output such as printing, where the image is drawn once
+        with QPainter.drawImage; unlike get_page_pixmap the result is not cached.
+        """
+        try:
+            rendered = self._render_image(page_num, scale, rotation)
+            if rendered is None:
                 return None
-        return None
+            img, pix = rendered
+            img._pix = pix # The image borrows pix's samples; keep pix alive with it
+            return img
+        except Exception as e:
+            logger.error("Error getting image for page %d: %s", page_num, e)
+            return None
+
+    def render_page_async(self, page_num: int, scale: float = 1.0, rotation: int = 0, callback=None):
+        """Renders a page on a background thread instead of blocking the caller.
+
+        callback(page_num, qpixmap) is invoked on the GUI thread once the page
+        is ready (immediately if it is already cached), or with None if
+        rendering fails. If the document changed in the meantime the page is
+        rendered again before the callback runs.
+        """
+        key = (page_num, round(scale, 3), rotation)
+        cached = self._pix_cache.get(key)
+        if cached is not None:
+            self._pix_cache.move_to_end(key)
+            if callback:
+                callback(page_num, cached)
+            return
+
+        task = _RenderTask(self, page_num, scale, rotation, self._render_generation)
+        task.key = key
+        task.is_prefetch = callback is None
+        self._render_tasks.add(task)
+        self._render_pending.add(key)
+
+        def on_finished(image: QImage, generation: int):
+            self._render_tasks.discard(task)
+            self._render_pending.discard(key)
+            if generation != self._render_generation:
+                if callback and self.doc and 0 <= page_num < self._page_count:
+                    self.render_page_async(page_num, scale, rotation, callback) # Result is stale; try again
+                return
+            if image.isNull():
+                if callback:
+                    callback(page_num, None)
+                return
+            # QPixmap must be created on the GUI thread, which is where this runs
+            qpixmap = QPixmap.fromImage(image)
+            self._cache_pixmap(key, qpixmap)
+            if callback:
+                callback(page_num, qpixmap)
+
+        task.signals.finished.connect(on_finished)
+        # Pages someone waits for go ahead of queued prefetches
+        self._render_pool.start(task, 1 if callback else 0)
+
+    def prefetch(self, page_num: int, scale: float = 1.0, rotation: int = 0, radius: int = 2):
+        """Renders up to radius pages on either side of page_num in the background.
+
+        Pages already cached or being rendered are skipped, nearest pages go first.
+        """
+        n = self.page_count
+        rounded = round(scale, 3)
+        for distance in range(1, radius + 1):
+            for neighbour in (page_num + distance, page_num - distance):
+                key = (neighbour, rounded, rotation)
+                if 0 <= neighbour < n and key not in self._pix_cache and key not in self._render_pending:
+                    self.render_page_async(neighbour, scale, rotation)
 
 
+    def cancel_prefetch(self):
+        """Drops queued prefetch renders that haven't started yet.
+
+        Renders hold the document lock, so this keeps them from delaying the
+        GUI thread while it edits annotations, e.g. during a drag or resize.
+        """
+        for task in [t for t in self._render_tasks if t.is_prefetch]:
+            if self._render_pool.tryTake(task): # False once the task is running
+                self._render_tasks.discard(task)
+                self._render_pending.discard(task.key)
+
+    def _drop_document_caches(self):
+        """Forgets rendered pixmaps, loaded pages and MuPDF's resource store for self.doc."""
+        with self._doc_lock:
+            self.invalidate_pixmaps()
+            self._page_cache.clear()
+            if self._annotations:
+                self._annotations.invalidate_pages()
+            fitz.TOOLS.store_shrink(100)
+
     def save_document(self, filepath: str | None = None):
-        """Saves the document. If filepath is None, saves to the original path."""
+        """Saves the document. If filepath is None, saves to the original path.
+
+        A full (non-incremental) save may renumber objects, so cached pixmaps
+        and pages are dropped first; callers holding fitz.Page or fitz.Annot
+        objects must fetch them again afterwards.
+        """
         if not self.doc:
-            print("No document open to save.")
+            logger.warning("No document open to save.")
             return False
 
-        if not self.modified and filepath is None:
-            print("No modifications to save.")
-            return True # Nothing to do
-
         save_path = filepath if filepath else self.filepath
-        if not save_path:
-            print("Cannot save document without a filepath.")
-            # Maybe trigger Save As? For now, return False
-            return False
-
-        try:
-            if save_path == self.filepath:
-                # To save to the same file without incremental errors, 
-                # we save to a temporary file, close, replace, and re-open.
-                temp_path = save_path + ".tmp"
-                self.doc.save(temp_path, incremental=False)
-                
-                # Store the current page index to restore after re-opening
-                # Note: This handler doesn't know the current page, 
-                # but the viewer will likely refresh.
-                
-                self.doc.close()
-                if os.path.exists(save_path):
-                    os.remove(save_path)
-                os.rename(temp_path, save_path)
+        with self._doc_lock: # No background render while the document is saved or re-opened
+            temp_path = None
+            try:
+                if self._annotations:
+                    self._annotations.flush() # Apply any deferred annotation updates first
+
+                if not self.modified and filepath is None:
+                    logger.debug("No modifications to save.")
+                    return True # Nothing to do
+
+                if not save_path:
+                    logger.warning("Cannot save document without a filepath.")
+                    # Maybe trigger Save As? For now, return False
+                    return False
+
+                if save_path == self.filepath and self.doc.name == save_path and self.doc.can_save_incrementally():
+                    # Append only the changed objects and a new trailer instead of
+                    # rewriting the whole file; pages and annotations stay valid
+                    self.doc.save(save_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+                elif save_path == self.filepath:
+                    # To save to the same file without incremental errors, 
+                    # we save to a temporary file, close, replace, and re-open.
+                    temp_path = save_path + ".tmp"
+                    self._drop_document_caches()
+                    self.doc.save(temp_path, incremental=False, **_FULL_SAVE_OPTS)
+                    # Make sure the new file is on disk before it replaces the original
+                    with open(temp_path, "r+b") as f:
+                        os.fsync(f.fileno())
+
+                    # Store the current page index to restore after re-opening
+                    # Note: This handler doesn't know the current page,
+                    # but the viewer will likely refresh.
+
+                    self.doc.close()
+                    # Atomic swap: the original is never left missing or half-written
+                    os.replace(temp_path, save_path)
                 
-                # Re-open the document to continue working
-                self.doc = fitz.open(save_path)
-                self.annotations = PDFAnnotations(self) # Re-init annotations handler
-            else:
-                self.doc.save(save_path, incremental=False)
-                self.filepath = save_path
+                    # Re-open the document to continue working
+                    self.doc = fitz.open(save_path)
+                    self._annotations = None # Re-created for the re-opened document on next use
+                else:
+                    self._drop_document_caches()
+                    self.doc.save(save_path, incremental=False, **_FULL_SAVE_OPTS)
+                    self.filepath = save_path
                 
-            self.modified = False
-            return True
-        except Exception as e:
-            print(f"Error saving PDF to {save_path}: {e}")
-            # Try to recover if possible?
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                try: os.remove(temp_path)
-                except: pass
-            return False
+                self.modified = False
+                # Saving touches every changed object; trim what MuPDF kept of that
+                fitz.TOOLS.store_shrink(50)
+                return True
+            except Exception as e:
+                logger.error("Error saving PDF to %s: %s", save_path, e)
+                # Try to recover if possible?
+                if temp_path:
+                    try: os.remove(temp_path)
+                    except OSError: pass # FileNotFoundError if the temp file was never written
+                return False
 
     def rotate_page(self, page_num: int, angle: int):
         """Rotates a specific page by the given angle (90, 180, 270).
@@ -162,23 +509,39 @@ class PDFHandler:
         Returns:
             True if rotation was successful, False otherwise.
         """
-        if not self.doc or not (0 <= page_num < self.page_count):
+        return self.rotate_pages([page_num], angle)
+
+    def rotate_pages(self, page_nums: list[int], angle: int):
+        """Rotates several pages by the same angle (90, 180, 270), see rotate_page.
+
+        Returns:
+            True if all pages were rotated, False otherwise (nothing is rotated
+            if any page number is invalid).
+        """
+        n = self.page_count
+        if not self.doc or not page_nums or not all(0 <= p < n for p in page_nums):
             return False
         if angle not in [90, 180, 270]:
-             print(f"Invalid rotation angle: {angle}. Must be 90, 180, or 270.")
+             logger.warning("Invalid rotation angle: %s. Must be 90, 180, or 270.", angle)
              return False
 
+        rotated = [] # Pages actually rotated, each page once
         try:
-            page = self.doc[page_num]
-            # Calculate the new rotation angle based on the current rotation
-            current_rotation = page.rotation
-            new_rotation = (current_rotation + angle) % 360
-            page.set_rotation(new_rotation)
-            self.modified = True
+            with self._doc_lock:
+                for page_num in set(page_nums):
+                    page = self.get_page(page_num)
+                    # Calculate the new rotation angle based on the current rotation
+                    page.set_rotation((page.rotation + angle) % 360)
+                    rotated.append(page_num)
             return True
         except Exception as e:
-            print(f"Error rotating page {page_num}: {e}")
+            logger.error("Error rotating pages %s: %s", page_nums, e)
             return False
+        finally:
+            # Invalidate once for the whole batch, even if it stopped part-way
+            if rotated:
+                self.invalidate_pixmaps(rotated)
+                self.modified = True
 
     def move_page(self, from_index: int, to_index: int):
         """Moves a page from one position to another."""
@@ -187,11 +550,13 @@ class PDFHandler:
         
         try:
             # PyMuPDF's move_page is smart about adjusting indices
-            self.doc.move_page(from_index, to_index)
+            with self._doc_lock:
+                self.doc.move_page(from_index, to_index)
+                self._on_structure_changed()
             self.modified = True
             return True
         except Exception as e:
-            print(f"Error moving page: {e}")
+            logger.error("Error moving page: %s", e)
             return False
 
     def add_blank_page(self, width: float = 595, height: float = 842, index: int = -1):
@@ -199,44 +564,95 @@ class PDFHandler:
         if not self.doc: return False
         try:
             # Default A4 size in points
-            self.doc.new_page(pno=index, width=width, height=height)
+            with self._doc_lock:
+                self.doc.new_page(pno=index, width=width, height=height)
+                self._on_structure_changed()
             self.modified = True
             return True
         except Exception as e:
-            print(f"Error adding blank page: {e}")
+            logger.error("Error adding blank page: %s", e)
             return False
 
     def delete_page(self, page_num: int):
         """Deletes a specific page."""
-        if not self.doc or not (0 <= page_num < self.page_count): return False
+        return self.delete_pages([page_num])
+
+    def delete_pages(self, page_nums: list[int]):
+        """Deletes several pages at once (nothing is deleted if any page number is invalid)."""
+        n = self.page_count
+        if not self.doc or not page_nums or not all(0 <= p < n for p in page_nums): return False
         try:
-            self.doc.delete_page(page_num)
+            with self._doc_lock:
+                self.doc.delete_pages(sorted(set(page_nums)))
+                self._on_structure_changed()
             self.modified = True
             return True
         except Exception as e:
-            print(f"Error deleting page {page_num}: {e}")
+            logger.error("Error deleting pages %s: %s", page_nums, e)
             return False
 
     def merge_document(self, other_pdf_path: str):
         """Merges another PDF document into the current one."""
+        return self.merge_documents([other_pdf_path]) == 1
+
+    def merge_documents(self, other_pdf_paths: list[str]) -> int:
+        """Appends several PDF documents, in order, to the current one.
+
+        Files that are missing or fail to open are logged and skipped.
+
+        Returns:
+            The number of documents that were merged.
+        """
         if not self.doc:
-            print("No document open to merge into.")
-            return False
-        if not os.path.exists(other_pdf_path):
-            print(f"File not found: {other_pdf_path}")
-            return False
-        try:
-            other_doc = fitz.open(other_pdf_path)
-            self.doc.insert_pdf(other_doc)
-            other_doc.close()
+            logger.warning("No document open to merge into.")
+            return 0
+        merged = 0
+        # Held for the whole batch: each insert_pdf orphans the cached pages, and
+        # the caches and page count are only refreshed once all files are in
+        with self._doc_lock:
+            for other_pdf_path in other_pdf_paths:
+                try:
+                    # fitz.open reports a missing file itself; no separate exists() check
+                    with fitz.open(other_pdf_path) as other_doc:
+                        self.doc.insert_pdf(other_doc)
+                    merged += 1
+                    logger.info("Merged document %s into %s", other_pdf_path, self.filepath)
+                except FileNotFoundError:
+                    logger.warning("File not found: %s", other_pdf_path)
+                except Exception as e:
+                    logger.error("Error merging document %s: %s", other_pdf_path, e)
+            if merged:
+                # Bookkeeping once for the whole batch
+                self._on_structure_changed()
+                # The merged files are closed; don't keep their fonts/images in MuPDF's store
+                fitz.TOOLS.store_shrink(100)
+        if merged:
             self.modified = True
-            print(f"Merged document {other_pdf_path} into {self.filepath}")
-            return True
-        except Exception as e:
-            print(f"Error merging document {other_pdf_path}: {e}")
-            return False
+        return merged
             
-    def split_pdf(self, output_dir: str, split_all: bool, page_ranges: list[tuple[int, int]] | None) -> tuple[bool, str]:
+    def _worker_pool(self, processes: int):
+        """Returns a process pool whose workers each have their own copy of self.doc."""
+        # Workers can't share self.doc, so each opens its own copy: the file
+        # itself if it is unchanged, otherwise the in-memory state as bytes
+        with self._doc_lock:
+            if not self.modified and self.doc.name == self.filepath:
+                source = self.filepath
+            else:
+                source = self.doc.tobytes()
+        # spawn everywhere: forking a process that runs Qt threads is unsafe
+        ctx = multiprocessing.get_context("spawn")
+        return ctx.Pool(processes, initializer=_init_worker_doc, initargs=(source,))
+
+    def _write_range(self, start_page: int, end_page: int, output_filename: str):
+        """Writes pages start_page..end_page (inclusive, 0-indexed) to a new PDF file."""
+        with fitz.open() as new_doc: # Create a new empty PDF
+            # Reading from self.doc is serialized; saving the new file is not
+            with self._doc_lock:
+                new_doc.insert_pdf(self.doc, from_page=start_page, to_page=end_page)
+            _save_split_part(new_doc, output_filename)
+
+    def split_pdf(self, output_dir: str, split_all: bool, page_ranges: list[tuple[int, int]] | None,
+                  workers: int = 1) -> tuple[bool, str]:
         """Splits the current PDF based on the provided options.
 
         Args:
@@ -244,79 +660,114 @@ class PDFHandler:
             split_all: If True, split every page into a separate file.
             page_ranges: A list of (start_page, end_page) tuples (0-indexed) 
                          to split by range. Used if split_all is False.
+            workers: Number of worker processes writing output files in parallel.
+                     The default of 1 writes them one after another in this process,
+                     as do splits of fewer than _SPLIT_POOL_MIN_PAGES pages in total.
 
         Returns:
             A tuple (success: bool, message: str).
         """
         if not self.doc or not self.filepath:
             return False, "No document open to split."
-        if not os.path.isdir(output_dir):
-            return False, f"Output directory does not exist: {output_dir}"
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            return False, f"Output directory is not usable: {output_dir} ({e})"
 
         base_filename = os.path.splitext(os.path.basename(self.filepath))[0]
-        split_count = 0
+        prefix = os.path.join(output_dir, base_filename) # Joined once, not per output file
+        n = self.page_count
 
         try:
             if split_all:
                 # Split every page
-                for i in range(self.page_count):
-                    new_doc = fitz.open() # Create a new empty PDF
-                    new_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                    output_filename = os.path.join(output_dir, f"{base_filename}_page_{i + 1}.pdf")
-                    new_doc.save(output_filename)
-                    new_doc.close()
-                    split_count += 1
-                message = f"{split_count} sayfa başarıyla ayrı PDF dosyalarına bölündü."
+                jobs = [(i, i, f"{prefix}_page_{i + 1}.pdf") for i in range(n)]
+                message = "{} sayfa başarıyla ayrı PDF dosyalarına bölündü."
 
             elif page_ranges:
                 # Split by ranges
-                range_num = 1
+                jobs = [] # (start_page, end_page, output_filename)
                 for start_page, end_page in page_ranges:
-                    if 0 <= start_page < self.page_count and 0 <= end_page < self.page_count and start_page <= end_page:
-                        new_doc = fitz.open()
-                        new_doc.insert_pdf(self.doc, from_page=start_page, to_page=end_page)
+                    if 0 <= start_page <= end_page < n:
                         # Determine output filename based on range
                         if start_page == end_page:
                             range_desc = f"page_{start_page + 1}"
                         else:
                             range_desc = f"pages_{start_page + 1}-{end_page + 1}"
-                        output_filename = os.path.join(output_dir, f"{base_filename}_{range_desc}.pdf")
-                        new_doc.save(output_filename)
-                        new_doc.close()
-                        split_count += 1
-                        range_num += 1
+                        jobs.append((start_page, end_page, f"{prefix}_{range_desc}.pdf"))
                     else:
-                        print(f"Skipping invalid page range: {start_page+1}-{end_page+1}")
-                message = f"{split_count} PDF dosyası belirtilen aralıklara göre başarıyla oluşturuldu."
+                        logger.debug("Skipping invalid page range: %d-%d", start_page + 1, end_page + 1)
+                message = "{} PDF dosyası belirtilen aralıklara göre başarıyla oluşturuldu."
             
             else:
                 return False, "Geçersiz bölme seçeneği."
 
-            return True, message
+            total_pages = sum(end_page - start_page + 1 for start_page, end_page, _ in jobs)
+            if workers > 1 and len(jobs) > 1 and total_pages >= _SPLIT_POOL_MIN_PAGES:
+                with self._worker_pool(min(workers, len(jobs))) as pool:
+                    pool.map(_split_one, jobs) # Re-raises the first failure
+            else:
+                for job in jobs:
+                    self._write_range(*job)
+                # Copying the pages filled MuPDF's store in this process
+                with self._doc_lock:
+                    fitz.TOOLS.store_shrink(50)
+
+            return True, message.format(len(jobs))
 
         except Exception as e:
             error_message = f"PDF bölme sırasında hata oluştu: {e}"
-            print(error_message)
+            logger.error(error_message)
             return False, error_message
 
-    def extract_text(self, page_num: int) -> str | None:
-        """Extracts text from a specific page."""
+    def extract_text(self, page_num: int, mode: str = "text", flags: int | None = None) -> str | list | dict | None:
+        """Extracts text from a specific page.
+
+        Args:
+            page_num: The page number (0-indexed).
+            mode: Output format passed to fitz.Page.get_text ("text", "blocks",
+                  "words", "dict", ...). "text" returns a plain string.
+            flags: Optional fitz.TEXT_* flags. Callers that only need the
+                   characters can pass e.g. fitz.TEXT_MEDIABOX_CLIP to skip
+                   ligature and whitespace preservation.
+        """
         if not self.doc or not (0 <= page_num < self.page_count):
-            print(f"Invalid document or page number: {page_num}")
+            logger.warning("Invalid document or page number: %s", page_num)
             return None
             
         try:
-            # Get the page
-            page = self.doc[page_num]
-            
-            # Extract text from the page
-            text = page.get_text()
+            with self._doc_lock:
+                # Get the page
+                page = self.get_page(page_num)
+                
+                # Extract text from the page
+                text = page.get_text(mode, flags=flags)
             
             return text
         except Exception as e:
-            print(f"Error extracting text from page {page_num}: {e}")
+            logger.error("Error extracting text from page %d: %s", page_num, e)
             return None
             
+    def extract_all_text(self, mode: str = "text", flags: int | None = None) -> list:
+        """Extracts text from every page, e.g. for searching or indexing.
+
+        Args:
+            mode, flags: As for extract_text.
+
+        Returns:
+            One get_text result per page (empty list if no document is open).
+        """
+        if not self.doc:
+            return []
+        try:
+            # Iterate the document directly: a full pass would only evict the
+            # pages the viewer is actually using from get_page's cache
+            with self._doc_lock:
+                return [page.get_text(mode, flags=flags) for page in self.doc]
+        except Exception as e:
+            logger.error("Error extracting text: %s", e)
+            return []
+
     def save_page_as_image(self, page_num: int, filepath: str, dpi: int = 300, image_format: str = "png"):
         """Saves a specific page as an image file.
         
@@ -330,46 +781,83 @@ class PDFHandler:
             True if successful, False otherwise.
         """
         if not self.doc or not (0 <= page_num < self.page_count):
-            print(f"Invalid document or page number: {page_num}")
+            logger.warning("Invalid document or page number: %s", page_num)
             return False
             
         try:
-            # Get the page
-            page = self.doc[page_num]
+            with self._doc_lock:
+                # Get the page
+                page = self.get_page(page_num)
             
-            # Calculate the zoom factor based on DPI
-            # Standard PDF resolution is 72 DPI, so we calculate the zoom factor
-            zoom = dpi / 72
+                # Calculate the zoom factor based on DPI
+                # Standard PDF resolution is 72 DPI, so we calculate the zoom factor
+                zoom = dpi / 72
             
-            # Create a pixmap with the specified zoom factor
-            # Use RGB color space (no alpha channel)
-            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                # Create a pixmap with the specified zoom factor
+                # Use RGB color space (no alpha channel)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
             
-            pix.save(filepath)
+                pix.save(filepath)
+            pix = None # Free the (large, high-DPI) samples before returning
             return True
         except Exception as e:
-            print(f"Error saving page as image: {e}")
+            logger.error("Error saving page as image: %s", e)
             return False
             
-    def add_note(self, page_index, position, content, username=None):
-        """Add a note annotation to the PDF.
-        
+    def save_pages_as_images(self, page_nums: list[int], output_dir: str, dpi: int = 300,
+                             image_format: str = "png", workers: int = 1) -> list[str]:
+        """Saves several pages as image files named <pdf name>_page_<n>.<format>.
+
         Args:
-            page_index: The 0-based index of the page.
-            position: The position (QPoint) where the note should be placed.
-            content: The content of the note.
-            username: The username of the note creator.
-            
+            page_nums: The page numbers to save (0-indexed). Invalid ones are skipped.
+            output_dir: The directory to save the images to.
+            dpi: The resolution in dots per inch (default: 300).
+            image_format: "png", "jpg"/"jpeg" or another format fitz.Pixmap.save supports.
+            workers: Number of worker processes rendering and encoding pages in
+                     parallel. The default of 1 exports in this process, as do
+                     exports of fewer than _EXPORT_POOL_MIN_PAGES pages.
+
         Returns:
-            The annotation object if successful, None otherwise.
+            The paths of the images that were written.
         """
-        if not self.doc or not self.annotations or not (0 <= page_index < self.page_count):
-            return None
-            
-        # Create a small rectangle around the position
-        x, y = position.x(), position.y()
-        rect = QRectF(x - 10, y - 10, 20, 20)  # 20x20 rectangle centered at position
-        
+        if not self.doc:
+            logger.warning("No document open to export.")
+            return []
+
+        base_filename = os.path.splitext(os.path.basename(self.filepath or "document"))[0]
+        prefix = os.path.join(output_dir, base_filename)
+        image_format = image_format.lower()
+        n = self.page_count
+        zoom = dpi / 72
+        jobs = [] # (page_num, filepath, zoom, image_format)
+        for page_num in page_nums:
+            if not (0 <= page_num < n):
+                logger.warning("Invalid page number: %s", page_num)
+                continue
+            jobs.append((page_num, f"{prefix}_page_{page_num + 1}.{image_format}", zoom, image_format))
+
+        if workers > 1 and len(jobs) >= _EXPORT_POOL_MIN_PAGES:
+            with self._worker_pool(min(workers, len(jobs))) as pool:
+                errors = pool.map(_export_one, jobs)
+        else:
+            matrix = fitz.Matrix(zoom, zoom) # Same for every page
+            errors = []
+            for page_num, filepath, _, _ in jobs:
+                try:
+                    with self._doc_lock:
+                        _save_page_image(self.doc, page_num, filepath, matrix, image_format)
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(str(e))
+
+        created_files = []
+        for (page_num, filepath, _, _), error in zip(jobs, errors):
+            if error is None:
+                created_files.append(filepath)
+            else:
+                logger.error("Error saving page %d as image: %s", page_num, error)
+        return created_files
+
     def add_note(self, page_index, rect, content, username=None, color=(1, 1, 0)):
         """Add a sticky note annotation to the PDF."""
         if self.annotations:
@@ -410,11 +898,12 @@ class PDFHandler:
         """Finds and returns the annotation at the given point."""
         if not self.doc or not (0 <= page_index < self.page_count):
             return None
-        page = self.doc[page_index]
         fitz_point = fitz.Point(point.x(), point.y())
-        for annot in page.annots():
-            if fitz_point in annot.rect:
-                return annot
+        with self._doc_lock:
+            page = self.get_page(page_index)
+            for annot in page.annots():
+                if fitz_point in annot.rect:
+                    return annot
         return None
 
     def get_annotation_content_at_point(self, page_index, point):
@@ -422,19 +911,19 @@ class PDFHandler:
         if not self.doc or not (0 <= page_index < self.page_count):
             return None
         try:
-            page = self.doc[page_index]
             fitz_point = fitz.Point(point.x(), point.y())
-            for annot in page.annots():
-                if fitz_point in annot.rect:
-                    info = annot.info
-                    content = info.get("content")
-                    if not content:
-                        content = info.get("title")
-                    return content
+            with self._doc_lock:
+                page = self.get_page(page_index)
+                for annot in page.annots():
+                    if fitz_point in annot.rect:
+                        info = annot.info
+                        content = info.get("content")
+                        if not content:
+                            content = info.get("title")
+                        return content
             return None
         except Exception as e:
-            import logging
-            logging.getLogger("pdf_handler").error(f"Error getting annotation at point: {e}")
+            logger.error("Error getting annotation at point: %s", e)
             return None
 
 
@@ -3,8 +3,22 @@ from PyQt6.QtGui import QPixmap, QFont
 from PyQt6.QtCore import Qt
 import os
 
+_LOGO_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "splash.png")
+
 class AboutDialog(QDialog):
     """About dialog showing app information."""
+
+    _cached_logo: QPixmap | None = None # Scaled logo, loaded on first open
+
+    @classmethod
+    def _logo(cls) -> QPixmap:
+        """Returns the scaled logo, reading and scaling splash.png only once."""
+        if cls._cached_logo is None:
+            pixmap = QPixmap(_LOGO_PATH) # Null if the file is missing
+            if not pixmap.isNull():
+                pixmap = pixmap.scaled(250, 250, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            cls._cached_logo = pixmap
+        return cls._cached_logo
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -18,11 +32,9 @@ class AboutDialog(QDialog):
         
         # Logo
         logo_label = QLabel()
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "splash.png")
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            scaled_pixmap = pixmap.scaled(250, 250, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
+        logo = self._logo()
+        if not logo.isNull():
+            logo_label.setPixmap(logo)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(logo_label)
         
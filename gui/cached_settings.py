@@ -0,0 +1,32 @@
+from PyQt6.QtCore import QSettings
+
+class CachedSettings:
+    """In-memory view of QSettings that writes changed keys back only on sync().
+
+    QSettings may hit the registry or a settings file on every call, so values
+    are read once at startup and changes are written in one burst, e.g. when
+    the main window closes.
+    """
+
+    def __init__(self, organization, application):
+        self._settings = QSettings(organization, application)
+        self._cache = {key: self._settings.value(key) for key in self._settings.allKeys()}
+        self._dirty = set() # Keys changed since the last sync()
+
+    def value(self, key, default=None):
+        """Returns the cached value for key, or default if it was never stored."""
+        return self._cache.get(key, default)
+
+    def setValue(self, key, value):
+        """Updates key in memory; unchanged values are not marked for writing."""
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    def sync(self):
+        """Writes all changed keys to the underlying QSettings."""
+        for key in self._dirty:
+            self._settings.setValue(key, self._cache[key])
+        self._dirty.clear()
+        self._settings.sync()
@@ -1,25 +1,299 @@
 import sys
 import os # Import os
+import logging
+import functools
+import contextlib
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 import qt_material # Import qt_material to get its path
 
-from PyQt6.QtGui import QAction, QIcon, QPainter
+from PyQt6.QtGui import QAction, QIcon, QKeySequence, QColor, QPalette
 from PyQt6.QtWidgets import QMainWindow, QApplication, QLabel, QMenu, QMenuBar, QFileDialog, QComboBox, QPushButton, \
-    QDockWidget, QWidget, QVBoxLayout, QHBoxLayout
-from PyQt6.QtCore import Qt, QSettings
-from PyQt6.QtPrintSupport import QPrinter, QPrintDialog, QPrintPreviewDialog
+    QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QProgressDialog
+from PyQt6.QtCore import Qt, QRect, QTimer, QStandardPaths
 
 from core.pdf_handler import PDFHandler 
 from gui.pdf_viewer import PDFViewer
 from gui.thumbnail_view import ThumbnailView 
 from gui.toolbar_manager import ToolbarManager
 from gui.svg_utils import get_icon_for_theme
-from qt_material import apply_stylesheet, set_icons_theme, get_theme
+from qt_material import apply_stylesheet, set_icons_theme, get_theme, add_fonts
 from gui.properties_bar import PropertiesBar
 from gui.about_dialog import AboutDialog
+from gui.cached_settings import CachedSettings
+
+logger = logging.getLogger(__name__)
+
+# Pages rendered ahead of the one being printed. PDFHandler serializes
+# rendering on its document lock, so more workers would only wait.
+_PRINT_PREFETCH = 2
+# How long printing waits for a page render before handling events again
+_PRINT_POLL_S = 0.05
+
+# Delay before a requested page is rendered; coalesces rapid page changes
+_PAGE_DEBOUNCE_MS = 16
+
+# qt-material themes offered in the theme combo box
+_THEMES: tuple[str, ...] = (
+    "dark_amber", "dark_blue", "dark_cyan", "dark_lightgreen", "dark_medical",
+    "dark_pink", "dark_purple", "dark_red", "dark_teal", "dark_yellow",
+    "light_amber", "light_blue_500", "light_blue", "light_cyan_500", "light_cyan",
+    "light_lightgreen_500", "light_lightgreen", "light_orange", "light_pink_500",
+    "light_pink", "light_purple_500", "light_purple", "light_red_500", "light_red",
+    "light_teal_500", "light_teal", "light_yellow"
+)
+_THEME_DIR = os.path.join(qt_material.__path__[0], 'themes')
+_THEME_CACHE = {} # theme name -> (theme file path, parsed theme data or None)
+
+def _theme_entry(theme_name):
+    """Returns (theme file path, theme data) for theme_name, or None if the file is missing.
+
+    The file check and the XML parse in get_theme() run once per theme.
+    """
+    entry = _THEME_CACHE.get(theme_name)
+    if entry is None:
+        theme_file_path = os.path.join(_THEME_DIR, f"{theme_name}.xml")
+        if not os.path.exists(theme_file_path):
+            return None
+        try:
+            theme_data = get_theme(theme_name) # get_theme uses the name without extension
+        except Exception as theme_error:
+            logger.warning("Error getting theme data for %s: %s. Skipping explicit icon theme setting.", theme_name, theme_error)
+            theme_data = None
+        entry = _THEME_CACHE[theme_name] = (theme_file_path, theme_data)
+    return entry
+
+_QSS_CACHE: dict[str, str] = {} # theme name -> stylesheet built by qt_material's apply_stylesheet()
+
+def _qss_cache_path(theme_name):
+    """Returns the on-disk cache file for theme_name's stylesheet, keyed by qt_material version."""
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    version = getattr(qt_material, '__version__', '')
+    return os.path.join(cache_dir, 'qss', f"{theme_name}-{version}.qss")
+
+def _load_qss(theme_name):
+    """Returns the cached stylesheet of theme_name from memory or disk, or None."""
+    qss = _QSS_CACHE.get(theme_name)
+    if qss is None:
+        try:
+            with open(_qss_cache_path(theme_name), encoding='utf-8') as f:
+                qss = _QSS_CACHE[theme_name] = f.read()
+        except OSError: # FileNotFoundError until the theme has been applied once
+            return None
+    return qss
+
+def _store_qss(theme_name, qss):
+    """Keeps theme_name's stylesheet in memory and writes it to the disk cache."""
+    _QSS_CACHE[theme_name] = qss
+    cache_path = _qss_cache_path(theme_name)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(qss)
+    except OSError as e:
+        logger.debug("Could not write stylesheet cache %s: %s", cache_path, e)
+
+def _apply_theme_extras(app, theme_data):
+    """Does what apply_stylesheet() does besides building the stylesheet.
+
+    Registers the Roboto fonts the stylesheet refers to, regenerates the
+    icons its stylesheets share in one folder, and sets the placeholder
+    text color of the palette.
+    """
+    try:
+        add_fonts()
+    except Exception as e:
+        logger.warning("Could not register qt_material fonts: %s", e)
+    set_icons_theme(theme_data)
+    text_color = theme_data.get('primaryTextColor')
+    if text_color:
+        palette = app.palette()
+        color = QColor(text_color)
+        color.setAlpha(92) # Same dimmed placeholder color as apply_stylesheet
+        palette.setColor(QPalette.ColorRole.PlaceholderText, color)
+        app.setPalette(palette)
+
+def apply_theme_stylesheet(app, theme_name):
+    """Applies the qt-material theme theme_name to app, reusing its cached stylesheet if any.
+
+    Returns:
+        False if qt_material has no such theme, True otherwise.
+    """
+    entry = _theme_entry(theme_name)
+    if entry is None:
+        logger.error("Theme file not found for %s", theme_name)
+        return False
+    theme_file_path, theme_data = entry
+
+    qss = _load_qss(theme_name)
+    if qss and theme_data:
+        # Skip the XML and template work, but not the fonts, icons and palette
+        _apply_theme_extras(app, theme_data)
+        app.setStyleSheet(qss)
+        logger.debug("Applied cached stylesheet for: %s", theme_name)
+    else:
+        apply_stylesheet(app, theme=theme_file_path) # Pass full path
+        logger.debug("qt_material.apply_stylesheet called with path: %s", theme_file_path)
+        _store_qss(theme_name, app.styleSheet())
+
+    if theme_data and 'icon_theme' in theme_data:
+        logger.debug("Setting icon theme: %s", theme_data['icon_theme'])
+        set_icons_theme(theme_data['icon_theme'])
+    else:
+        # If no specific icon theme is defined, don't call set_icons_theme.
+        # Let qt-material handle defaults based on the main theme.
+        logger.debug("No specific icon theme found for %s. Skipping explicit icon theme setting.", theme_name)
+    return True
+
+# Table shortcuts that have a platform standard key; on platforms where the
+# standard key is unbound (e.g. SaveAs on Windows) the written form is kept.
+_STANDARD_KEYS = {
+    "Ctrl+O": QKeySequence.StandardKey.Open,
+    "Ctrl+S": QKeySequence.StandardKey.Save,
+    "Ctrl+Shift+S": QKeySequence.StandardKey.SaveAs,
+    "Ctrl+P": QKeySequence.StandardKey.Print,
+}
+_SHORTCUTS: dict[str, QKeySequence] = {} # table shortcut -> parsed key sequence
+
+def _shortcut(key):
+    """Returns the QKeySequence for a table shortcut, parsing each one only once.
+
+    Built on first use rather than at import, since standard keys need the
+    running application's platform theme.
+    """
+    sequence = _SHORTCUTS.get(key)
+    if sequence is None:
+        standard = _STANDARD_KEYS.get(key)
+        sequence = QKeySequence(standard) if standard is not None else QKeySequence()
+        if sequence.isEmpty():
+            sequence = QKeySequence(key)
+        _SHORTCUTS[key] = sequence
+    return sequence
+
+@contextlib.contextmanager
+def _signals_blocked(widget):
+    """Blocks widget's signals for the duration of the with block, even if it raises."""
+    widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(False)
+
+class LazyThemeCombo(QComboBox):
+    """Theme selector that only holds the current theme until its list is first opened."""
+
+    def __init__(self, current_theme, parent=None):
+        super().__init__(parent)
+        self.addItem(current_theme)
+        self._populated = False
+
+    def showPopup(self):
+        if not self._populated:
+            self._populated = True
+            current = self.currentText()
+            with _signals_blocked(self): # Repopulating is not a user choice
+                self.clear()
+                self.addItems(_THEMES)
+                self.setCurrentText(current)
+        super().showPopup()
 
 class MainWindow(QMainWindow):
     """Main application window for MantiPDF Editor."""
 
+    # Menu entries: (text, slot name, shortcut, icon name); None adds a separator.
+    # A (slot name, *args) tuple binds arguments to the slot, see _resolve_slot().
+    _MENUS = (
+        ("File", (
+            ("Open PDF", "open_pdf", "Ctrl+O", "open"),
+            ("Save PDF", "save_pdf", "Ctrl+S", "file-save"),
+            ("Save As...", "save_pdf_as", "Ctrl+Shift+S", "file-save-as"),
+            ("Print", "print_pdf", "Ctrl+P", "print"),
+        )),
+        ("Edit", (
+            ("Select", "select_tool", "V", "tool-select"),
+            None,
+            ("Add Note", "add_note", None, "edit-add-note"),
+            ("Add Text", "add_text", None, "edit-add-text"),
+            ("Add Line", "add_line", None, "edit-add-line"),
+            ("Highlight", "highlight", None, "edit-highlight"),
+            ("Add Circle", "add_circle", None, "edit-add-circle"),
+            ("Add Stamp", "add_stamp", None, "edit-add-stamp"),
+        )),
+        ("View", (
+            ("Zoom In", "zoom_in", "Ctrl++", "zoom-in"),
+            ("Zoom Out", "zoom_out", "Ctrl+-", "zoom-out"),
+            ("Zoom Fit", "zoom_fit", None, "zoom-fit"),
+            ("Zoom Width", "zoom_width", None, "zoom-width"),
+        )),
+        ("Page", (
+            ("First Page", "first_page", "Home", "go-first-page"),
+            ("Previous Page", "previous_page", "PgUp", "go-previous"),
+            ("Next Page", "next_page", "PgDown", "go-next"),
+            ("Last Page", "last_page", "End", "go-last-page"),
+            None,
+            ("Rotate Left", ("rotate_page", 270), "Ctrl+Shift+L", "page-rotate-left"), # saat yönünün tersine 90 derece
+            ("Rotate Right", ("rotate_page", 90), "Ctrl+Shift+R", "page-rotate-right"), # saat yönünde 90 derece
+            ("Rotate 180", ("rotate_page", 180), None, "page-rotate-180"),
+            None,
+            ("Add Blank Page", "add_page", "Ctrl+Shift+N", "page-add"),
+            ("Delete Current Page", "delete_page", "Ctrl+Shift+D", "page-delete"),
+        )),
+        ("Tools", (
+            ("Merge PDF...", "merge_pdf", None, "tool-merge"),
+            ("Merge PDF in Folder...", "merge_pdfs_in_folder", None, None),
+            ("Split PDF...", "split_pdf", None, "tool-split"),
+        )),
+        ("Help", (
+            ("Hakkında...", "show_about_dialog", None, "help-about"),
+        )),
+    )
+
+    # Toolbar entries: (tooltip, icon name, slot name, shortcut, edit mode); an
+    # edit mode makes the button checkable and registers it in self.edit_buttons.
+    # None adds a separator, "page_label" the page number label.
+    _TOOLBARS = (
+        ("File", (
+            ("Open", "open", "open_pdf", "Ctrl+O", None),
+            ("Save", "file-save", "save_pdf", "Ctrl+S", None),
+            ("Save As", "file-save-as", "save_pdf_as", "Ctrl+Shift+S", None),
+            ("Print", "print", "print_pdf", "Ctrl+P", None),
+        )),
+        ("Page", (
+            ("Add Page", "page-add", "add_page", "Ctrl+Shift+N", None),
+            ("Delete Page", "page-delete", "delete_page", "Ctrl+Shift+D", None),
+            ("Rotate Left", "page-rotate-left", ("rotate_page", 270), "Ctrl+Shift+L", None),
+            ("Rotate Right", "page-rotate-right", ("rotate_page", 90), "Ctrl+Shift+R", None),
+            ("Rotate 180", "page-rotate-180", ("rotate_page", 180), None, None),
+        )),
+        ("View", (
+            ("Zoom In", "zoom-in", "zoom_in", "Ctrl++", None),
+            ("Zoom Out", "zoom-out", "zoom_out", "Ctrl+-", None),
+            ("Zoom Fit", "zoom-fit", "zoom_fit", None, None),
+            ("Zoom Width", "zoom-width", "zoom_width", None, None),
+        )),
+        ("Navigation", (
+            ("First Page", "go-first-page", "first_page", "Home", None),
+            ("Previous Page", "go-previous", "previous_page", "PgUp", None),
+            "page_label",
+            ("Next Page", "go-next", "next_page", "PgDown", None),
+            ("Last Page", "go-last-page", "last_page", "End", None),
+        )),
+        ("Edit", (
+            ("Select", "tool-select", "select_tool", None, "select"),
+            None,
+            ("Add Note", "edit-add-note", "add_note", None, "note"),
+            ("Add Text", "edit-add-text", "add_text", None, "text"),
+            ("Add Line", "edit-add-line", "add_line", None, "line"),
+            ("Highlight", "edit-highlight", "highlight", None, "highlight"),
+            ("Add Circle", "edit-add-circle", "add_circle", None, "circle"),
+            ("Add Stamp", "edit-add-stamp", "add_stamp", None, "stamp"),
+            None,
+            ("Merge PDF", "tool-merge", "merge_pdf", None, None),
+            ("Split PDF", "tool-split", "split_pdf", None, None),
+        )),
+    )
+
     def __init__(self, app, parent=None):
         """Initialize the main window."""
         super().__init__(parent)
@@ -27,8 +301,14 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("MantiPDF Editor")
         self.setGeometry(100, 100, 1200, 800) # x, y, width, height
 
-        self.settings = QSettings("MantiPDF", "Editor")
+        self.settings = CachedSettings("MantiPDF", "Editor")
         self.current_theme = self.settings.value("theme", "dark_teal")
+        # Coalesces rapid theme combo changes into a single apply_theme() call
+        self._pending_theme = self.current_theme
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(150)
+        self._theme_timer.timeout.connect(lambda: self.apply_theme(self._pending_theme))
         # self.apply_theme(self.current_theme) # MOVED: Apply theme after UI is built
         
         # Uygulama başlangıcında tema bazlı SVG ikonlarını hazırla
@@ -40,6 +320,7 @@ class MainWindow(QMainWindow):
 
         # Initialize PDF viewer
         self.pdf_viewer = PDFViewer(self)
+        self._render_token = 0 # Bumped by display_page; drops superseded page requests
         self.edit_buttons = {} # Store edit buttons for toggle management
         
         # Setup central area with Properties Bar
@@ -59,10 +340,9 @@ class MainWindow(QMainWindow):
         self.pdf_viewer.annotation_selected.connect(self.on_annotation_selected)
         self.pdf_viewer.annotation_deselected.connect(self.on_annotation_deselected)
 
-        # Initialize Thumbnail view
-        self.thumbnail_view = ThumbnailView(self)
-        self.thumbnail_view.itemSelectionChanged.connect(self.on_thumbnail_selected)
-        self.thumbnail_view.page_moved.connect(self.on_page_moved)
+        # Thumbnail view is created on demand, see _ensure_thumbnail_view()
+        self.thumbnail_view = None
+        self._thumbnails_dirty = False # Set when pages change while the Pages dock is hidden
 
         # Create Dock Widget for Thumbnails and reorder buttons
         self.thumbnail_dock = QDockWidget("Pages", self)
@@ -71,8 +351,7 @@ class MainWindow(QMainWindow):
         thumbnail_layout = QVBoxLayout(thumbnail_container)
         thumbnail_layout.setContentsMargins(0, 0, 0, 0)
         thumbnail_layout.setSpacing(5)
-
-        thumbnail_layout.addWidget(self.thumbnail_view)
+        self._thumbnail_layout = thumbnail_layout
 
         # Create reorder buttons
         reorder_toolbar = QHBoxLayout()
@@ -105,6 +384,7 @@ class MainWindow(QMainWindow):
         self.thumbnail_dock.setWidget(thumbnail_container)
         self.thumbnail_dock.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea)
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.thumbnail_dock)
+        self.thumbnail_dock.visibilityChanged.connect(self._on_thumbnail_dock_visibility)
 
         # Connect reorder button signals
         self.move_to_top_btn.clicked.connect(lambda: self.move_selected_page("top"))
@@ -127,8 +407,13 @@ class MainWindow(QMainWindow):
         self.create_status_bar()
 
         # Restore window geometry and state (including toolbars and docks)
-        self.restoreGeometry(self.settings.value("geometry", b'')) # Provide default empty QByteArray
-        self.restoreState(self.settings.value("windowState", b'')) # Provide default empty QByteArray
+        # Skipped on first run, when nothing has been saved yet
+        saved_geometry = self.settings.value("geometry")
+        if saved_geometry:
+            self.restoreGeometry(saved_geometry)
+        saved_state = self.settings.value("windowState")
+        if saved_state:
+            self.restoreState(saved_state)
         
         # Ensure window is visible on screen
         geometry = self.geometry()
@@ -149,7 +434,7 @@ class MainWindow(QMainWindow):
             # but we might not have a page yet. set_scale handles this.
             self.pdf_viewer.set_scale(scale_factor)
         except (ValueError, TypeError): # Catch TypeError if value isn't convertible
-            print(f"Warning: Could not restore zoom scale from settings ('{saved_scale}'). Using default.")
+            logger.warning("Could not restore zoom scale from settings (%r). Using default.", saved_scale)
             self.pdf_viewer.set_scale(1.0)
 
 
@@ -165,150 +450,105 @@ class MainWindow(QMainWindow):
         menu_bar = QMenuBar(self)
         self.setMenuBar(menu_bar) # Set menu bar early
 
-        # --- File Menu ---
-        file_menu = menu_bar.addMenu("File")
-        self.add_menu_action(file_menu, "Open PDF", self.open_pdf, "Ctrl+O", "open")
-        self.add_menu_action(file_menu, "Save PDF", self.save_pdf, "Ctrl+S", "file-save")
-        self.add_menu_action(file_menu, "Save As...", self.save_pdf_as, "Ctrl+Shift+S", "file-save-as")
-        self.add_menu_action(file_menu, "Print", self.print_pdf, "Ctrl+P", "print")
-
-        # --- Edit Menu ---
-        edit_menu = menu_bar.addMenu("Edit")
-        self.add_menu_action(edit_menu, "Select", self.select_tool, shortcut="V", icon_name="tool-select")
-        edit_menu.addSeparator()
-        self.add_menu_action(edit_menu, "Add Note", self.add_note, icon_name="edit-add-note")
-        self.add_menu_action(edit_menu, "Add Text", self.add_text, icon_name="edit-add-text")
-        self.add_menu_action(edit_menu, "Add Line", self.add_line, icon_name="edit-add-line")
-        self.add_menu_action(edit_menu, "Highlight", self.highlight, icon_name="edit-highlight")
-        self.add_menu_action(edit_menu, "Add Circle", self.add_circle, icon_name="edit-add-circle")
-        self.add_menu_action(edit_menu, "Add Stamp", self.add_stamp, icon_name="edit-add-stamp")
-
-        # --- View Menu ---
-        view_menu = menu_bar.addMenu("View")
-        self.add_menu_action(view_menu, "Zoom In", self.zoom_in, "Ctrl++", "zoom-in")
-        self.add_menu_action(view_menu, "Zoom Out", self.zoom_out, "Ctrl+-", "zoom-out")
-        self.add_menu_action(view_menu, "Zoom Fit", self.zoom_fit, icon_name="zoom-fit")
-        self.add_menu_action(view_menu, "Zoom Width", self.zoom_width, icon_name="zoom-width")
+        menus = {}
+        for title, entries in self._MENUS:
+            menu = menus[title] = menu_bar.addMenu(title)
+            # Shortcuts only work once their action exists, and the native macOS
+            # menu bar hides empty menus, so only the other menus are filled lazily.
+            if sys.platform == "darwin" or any(entry and entry[2] for entry in entries):
+                self._populate_menu(menu, entries)
+            else:
+                menu.aboutToShow.connect(functools.partial(self._populate_menu_once, menu, entries))
+
+        view_menu = menus["View"]
         view_menu.addSeparator()
         toggle_thumbs_action = self.thumbnail_dock.toggleViewAction()
         toggle_thumbs_action.setText("Toggle Page Thumbnails")
-        toggle_thumbs_action.setShortcut("Ctrl+T")
+        toggle_thumbs_action.setShortcut(_shortcut("Ctrl+T"))
         view_menu.addAction(toggle_thumbs_action)
 
-        # --- Page Menu ---
-        page_menu = menu_bar.addMenu("Page")
-        self.add_menu_action(page_menu, "First Page", self.first_page, "Home", "go-first-page")
-        self.add_menu_action(page_menu, "Previous Page", self.previous_page, "PgUp", "go-previous")
-        self.add_menu_action(page_menu, "Next Page", self.next_page, "PgDown", "go-next")
-        self.add_menu_action(page_menu, "Last Page", self.last_page, "End", "go-last-page")
-        page_menu.addSeparator()
-        self.add_menu_action(page_menu, "Rotate Left", self.rotate_left, "Ctrl+Shift+L", "page-rotate-left")
-        self.add_menu_action(page_menu, "Rotate Right", self.rotate_right, "Ctrl+Shift+R", "page-rotate-right")
-        self.add_menu_action(page_menu, "Rotate 180", self.rotate_180, icon_name="page-rotate-180")
-        page_menu.addSeparator()
-        self.add_menu_action(page_menu, "Add Blank Page", self.add_page, "Ctrl+Shift+N", "page-add")
-        self.add_menu_action(page_menu, "Delete Current Page", self.delete_page, "Ctrl+Shift+D", "page-delete")
-
-        # --- Tools Menu ---
-        tools_menu = menu_bar.addMenu("Tools")
-        self.add_menu_action(tools_menu, "Merge PDF...", self.merge_pdf, icon_name="tool-merge")
-        self.add_menu_action(tools_menu, "Merge PDF in Folder...", self.merge_pdfs_in_folder)
-        self.add_menu_action(tools_menu, "Split PDF...", self.split_pdf, icon_name="tool-split")
-
-        # --- Help Menu ---
-        help_menu = menu_bar.addMenu("Help")
-        self.add_menu_action(help_menu, "Hakkında...", self.show_about_dialog, icon_name="help-about")
+    def _populate_menu(self, menu, entries):
+        """Adds the actions of one _MENUS entry list to menu."""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            text, slot_name, shortcut, icon_name = entry
+            self.add_menu_action(menu, text, self._resolve_slot(slot_name), shortcut, icon_name)
+
+    def _populate_menu_once(self, menu, entries):
+        """aboutToShow handler that fills a lazily built menu the first time it opens."""
+        if menu.isEmpty():
+            self._populate_menu(menu, entries)
+
+    def _resolve_slot(self, slot_name):
+        """Returns the method named by a table entry; a (name, *args) tuple binds the arguments."""
+        if isinstance(slot_name, tuple):
+            name, *args = slot_name
+            return functools.partial(getattr(self, name), *args)
+        return getattr(self, slot_name)
 
     def add_menu_action(self, menu, text, slot, shortcut=None, icon_name=None):
         """Helper to add an action to a menu."""
         action = QAction(text, self)
         if icon_name:
-            icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
-            icon_path = get_icon_for_theme(f"{icon_name}.svg", self.current_theme, icons_dir)
-            action.setIcon(QIcon(icon_path))
+            action.setIcon(self.toolbar_manager.themed_icon(icon_name))
         action.triggered.connect(slot)
         if shortcut:
-            action.setShortcut(shortcut)
+            action.setShortcut(_shortcut(shortcut))
         menu.addAction(action)
         return action
 
     def create_toolbars(self):
-        # File toolbar
-        file_toolbar = self.toolbar_manager.create_toolbar("File")
-        self.toolbar_manager.add_button(file_toolbar, "Open", "open", self.open_pdf).setShortcut("Ctrl+O")
-        self.toolbar_manager.add_button(file_toolbar, "Save", "file-save", self.save_pdf).setShortcut("Ctrl+S")
-        self.toolbar_manager.add_button(file_toolbar, "Save As", "file-save-as", self.save_pdf_as).setShortcut("Ctrl+Shift+S")
-        self.toolbar_manager.add_button(file_toolbar, "Print", "print", self.print_pdf).setShortcut("Ctrl+P")
-
-        # Print toolbar
-        # print_toolbar = self.toolbar_manager.create_toolbar("Print")
-        # self.toolbar_manager.add_button(print_toolbar, "Print", "print", self.print_pdf).setShortcut("Ctrl+P")
-
-        # Page toolbar
-        page_toolbar = self.toolbar_manager.create_toolbar("Page")
-        self.toolbar_manager.add_button(page_toolbar, "Add Page", "page-add", self.add_page).setShortcut("Ctrl+Shift+N")
-        self.toolbar_manager.add_button(page_toolbar, "Delete Page", "page-delete", self.delete_page).setShortcut("Ctrl+Shift+D")
-        self.toolbar_manager.add_button(page_toolbar, "Rotate Left", "page-rotate-left", self.rotate_left).setShortcut("Ctrl+Shift+L")
-        self.toolbar_manager.add_button(page_toolbar, "Rotate Right", "page-rotate-right", self.rotate_right).setShortcut("Ctrl+Shift+R")
-        self.toolbar_manager.add_button(page_toolbar, "Rotate 180", "page-rotate-180", self.rotate_180)
-
-        # View toolbar
-        view_toolbar = self.toolbar_manager.create_toolbar("View")
-        zoom_in_button = self.toolbar_manager.add_button(view_toolbar, "Zoom In", "zoom-in", self.zoom_in)
-        zoom_in_button.setShortcut("Ctrl++")
-        zoom_out_button = self.toolbar_manager.add_button(view_toolbar, "Zoom Out", "zoom-out", self.zoom_out)
-        zoom_out_button.setShortcut("Ctrl+-")
-        self.toolbar_manager.add_button(view_toolbar, "Zoom Fit", "zoom-fit", self.zoom_fit)
-        self.toolbar_manager.add_button(view_toolbar, "Zoom Width", "zoom-width", self.zoom_width)
-        
-        # Navigation toolbar - Sayfa gezinme kontrolleri için ayrı bir toolbar
-        navigation_toolbar = self.toolbar_manager.create_toolbar("Navigation")
-        first_page_button = self.toolbar_manager.add_button(navigation_toolbar, "First Page", "go-first-page", self.first_page)
-        first_page_button.setShortcut("Home")
-        previous_page_button = self.toolbar_manager.add_button(navigation_toolbar, "Previous Page", "go-previous", self.previous_page)
-        previous_page_button.setShortcut("PgUp")
-
-        # Add page number display/input
-        self.page_label = QLabel("Page: 0 / 0")
-        self.toolbar_manager.add_widget(navigation_toolbar, self.page_label)
-        # Consider adding a QSpinBox or QLineEdit for direct page input later
-
-
-        next_page_button = self.toolbar_manager.add_button(navigation_toolbar, "Next Page", "go-next", self.next_page)
-        next_page_button.setShortcut("PgDown")
-        last_page_button = self.toolbar_manager.add_button(navigation_toolbar, "Last Page", "go-last-page", self.last_page)
-        last_page_button.setShortcut("End")
-
+        """Creates the File toolbar; the others are built right after the first show."""
+        self.page_label = QLabel("Page: 0 / 0") # Page number display, used by update_status_bar
+        self._toolbars_built = False
+        file_title, file_entries = self._TOOLBARS[0]
+        self._add_toolbar(file_title, file_entries)
+
+    def showEvent(self, event):
+        """Schedules the remaining toolbars once the window has been shown."""
+        super().showEvent(event)
+        if not self._toolbars_built:
+            self._toolbars_built = True
+            # Let the first frame paint before building the rest
+            QTimer.singleShot(0, self._build_remaining_toolbars)
+
+    def _build_remaining_toolbars(self):
+        """Creates every toolbar after File, plus the theme selector."""
+        toolbars = {title: self._add_toolbar(title, entries) for title, entries in self._TOOLBARS[1:]}
 
         # Theme selection
-        theme_combo = QComboBox()
-        themes = [
-            "dark_amber", "dark_blue", "dark_cyan", "dark_lightgreen", "dark_medical",
-            "dark_pink", "dark_purple", "dark_red", "dark_teal", "dark_yellow",
-            "light_amber", "light_blue_500", "light_blue", "light_cyan_500", "light_cyan",
-            "light_lightgreen_500", "light_lightgreen", "light_orange", "light_pink_500",
-            "light_pink", "light_purple_500", "light_purple", "light_red_500", "light_red",
-            "light_teal_500", "light_teal", "light_yellow"
-        ]
-        theme_combo.addItems(themes)
-        theme_combo.setCurrentText(self.current_theme)
-        theme_combo.currentTextChanged.connect(self.apply_theme)
-        self.toolbar_manager.add_widget(view_toolbar, theme_combo)
-
-        # Edit toolbar
-        edit_toolbar = self.toolbar_manager.create_toolbar("Edit")
-        self.edit_buttons["select"] = self.toolbar_manager.add_button(edit_toolbar, "Select", "tool-select", self.select_tool, checkable=True)
-        self.toolbar_manager.add_separator(edit_toolbar)
-        self.edit_buttons["note"] = self.toolbar_manager.add_button(edit_toolbar, "Add Note", "edit-add-note", self.add_note, checkable=True)
-        self.edit_buttons["text"] = self.toolbar_manager.add_button(edit_toolbar, "Add Text", "edit-add-text", self.add_text, checkable=True)
-        self.edit_buttons["line"] = self.toolbar_manager.add_button(edit_toolbar, "Add Line", "edit-add-line", self.add_line, checkable=True)
-        self.edit_buttons["highlight"] = self.toolbar_manager.add_button(edit_toolbar, "Highlight", "edit-highlight", self.highlight, checkable=True)
-        self.edit_buttons["circle"] = self.toolbar_manager.add_button(edit_toolbar, "Add Circle", "edit-add-circle", self.add_circle, checkable=True)
-        self.edit_buttons["stamp"] = self.toolbar_manager.add_button(edit_toolbar, "Add Stamp", "edit-add-stamp", self.add_stamp, checkable=True)
-        
-        self.toolbar_manager.add_separator(edit_toolbar)
-        self.toolbar_manager.add_button(edit_toolbar, "Merge PDF", "tool-merge", self.merge_pdf)
-        self.toolbar_manager.add_button(edit_toolbar, "Split PDF", "tool-split", self.split_pdf)
+        theme_combo = LazyThemeCombo(self.current_theme)
+        # textActivated only fires on user choice, not on setCurrentText()
+        theme_combo.textActivated.connect(self._schedule_theme)
+        self.toolbar_manager.add_widget(toolbars["View"], theme_combo)
+
+        # The saved state could only place toolbars that existed in __init__
+        saved_state = self.settings.value("windowState")
+        if saved_state:
+            self.restoreState(saved_state)
+
+    def _add_toolbar(self, title, entries):
+        """Creates a toolbar from one of the _TOOLBARS entry lists."""
+        toolbar = self.toolbar_manager.create_toolbar(title)
+        for entry in entries:
+            if entry is None:
+                self.toolbar_manager.add_separator(toolbar)
+            elif entry == "page_label":
+                # Consider a QSpinBox for direct page input later
+                self.toolbar_manager.add_widget(toolbar, self.page_label)
+            else:
+                text, icon_name, slot_name, shortcut, edit_mode = entry
+                button = self.toolbar_manager.add_button(toolbar, text, icon_name, self._resolve_slot(slot_name),
+                                                         checkable=edit_mode is not None)
+                if shortcut:
+                    # The menu action owns the shortcut; only advertise it here
+                    native_text = _shortcut(shortcut).toString(QKeySequence.SequenceFormat.NativeText)
+                    button.setToolTip(f"{text} ({native_text})")
+                if edit_mode is not None:
+                    self.edit_buttons[edit_mode] = button
+        return toolbar
 
     def open_pdf(self):
         """Opens a PDF file using a file dialog."""
@@ -323,10 +563,11 @@ class MainWindow(QMainWindow):
                 self.update_status_bar()
                 self.setWindowTitle(f"MantiPDF Editor - {self.pdf_handler.filepath}")
             else:
-                print("Error opening PDF.") # TODO: Show error dialog
+                logger.error("Error opening PDF %s", filepath) # TODO: Show error dialog
                 self.setWindowTitle("MantiPDF Editor")
                 self.pdf_viewer.clear_display()
-                self.thumbnail_view.clear_thumbnails()
+                if self.thumbnail_view is not None:
+                    self.thumbnail_view.clear_thumbnails()
                 self.update_status_bar()
 
     def save_pdf(self):
@@ -341,7 +582,7 @@ class MainWindow(QMainWindow):
     def save_pdf_as(self):
         """Saves the PDF file with a new name."""
         if not self.pdf_handler.doc:
-            print("No document open to save.")
+            logger.debug("No document open to save.")
             return
 
         filepath, _ = QFileDialog.getSaveFileName(self, "Save PDF As...", self.pdf_handler.filepath or ".", "PDF Files (*.pdf)")
@@ -349,23 +590,25 @@ class MainWindow(QMainWindow):
             if self.pdf_handler.save_document(filepath):
                 self.update_status_bar()
                 self.setWindowTitle(f"MantiPDF Editor - {self.pdf_handler.filepath}")
-                print(f"Document saved as {filepath}.") # TODO: Status bar message
+                logger.info("Document saved as %s", filepath) # TODO: Status bar message
             else:
-                print(f"Failed to save document to {filepath}.") # TODO: Error dialog
+                logger.error("Failed to save document to %s", filepath) # TODO: Error dialog
 
     def display_page(self, page_index):
         """Displays the page at the given index."""
-        if self.pdf_handler.doc and 0 <= page_index < self.pdf_handler.page_count:
-            # Pass the handler and index to the viewer
-            self.pdf_viewer.display_page(self.pdf_handler, page_index)
+        self._render_token += 1 # Any page still waiting below is now stale
+        handler = self.pdf_handler
+        if handler.doc and 0 <= page_index < handler.page_count:
+            # Hand the page to the viewer after a short pause, so holding
+            # PgDown only renders the page the user stops on
+            QTimer.singleShot(_PAGE_DEBOUNCE_MS, functools.partial(self._show_page, self._render_token, page_index))
             self.current_page_index = page_index
             self.update_status_bar()
+            if self.thumbnail_view is None:
+                return
             # Update thumbnail selection without triggering signal loop
-            self.thumbnail_view.blockSignals(True)
-            items = self.thumbnail_view.findItems(f"Page {page_index + 1}", Qt.MatchFlag.MatchExactly)
-            if items:
-                self.thumbnail_view.setCurrentItem(items[0])
-            self.thumbnail_view.blockSignals(False)
+            with _signals_blocked(self.thumbnail_view):
+                self.thumbnail_view.setCurrentRow(page_index) # One row per page, in order
         else:
             # Clear display if page index is invalid (e.g., after deleting last page)
             self.pdf_viewer.clear_display()
@@ -373,33 +616,93 @@ class MainWindow(QMainWindow):
             self.update_status_bar()
 
 
+    def _show_page(self, token, page_index):
+        """Passes page_index to the viewer unless a newer display_page call superseded it."""
+        if token != self._render_token:
+            return
+        handler = self.pdf_handler
+        if handler.doc and 0 <= page_index < handler.page_count:
+            self.pdf_viewer.display_page(handler, page_index)
+
     def update_status_bar(self):
+        """Schedules a status bar update; calls within one frame are coalesced into one."""
+        if not self._status_timer.isActive():
+            # A different message at timeout means a hint was posted meanwhile
+            self._status_scheduled_msg = self.status_bar.currentMessage()
+        self._status_timer.start()
+
+    def _do_update_status_bar(self):
         """Updates the status bar with the current page number and modified status."""
-        if self.pdf_handler.doc:
-            page_num_text = f"Page {self.current_page_index + 1} of {self.pdf_handler.page_count}"
-            modified_text = " *" if self.pdf_handler.modified else ""
-            self.status_bar.showMessage(f"{page_num_text}{modified_text} | {self.pdf_handler.filepath or 'Untitled'}")
-            self.page_label.setText(page_num_text) # Update toolbar label too
+        handler = self.pdf_handler
+        if handler.doc:
+            key = (self.current_page_index, handler.page_count, handler.modified, handler.filepath)
         else:
-            self.status_bar.showMessage("No PDF loaded")
-            self.page_label.setText("Page: 0 / 0")
+            key = None
+        if key != self._status_key:
+            # Rebuild the texts only when something they show has changed
+            self._status_key = key
+            if key is not None:
+                page_num_text = f"Page {self.current_page_index + 1} of {handler.page_count}"
+                modified_text = " *" if handler.modified else ""
+                self._status_text = f"{page_num_text}{modified_text} | {handler.filepath or 'Untitled'}"
+            else:
+                page_num_text = "Page: 0 / 0"
+                self._status_text = "No PDF loaded"
+            self.page_label.setText(page_num_text) # Update toolbar label too
+        # Other code posts hints to the status bar; keep one posted after scheduling
+        current = self.status_bar.currentMessage()
+        if current != self._status_text and current == self._status_scheduled_msg:
+            self.status_bar.showMessage(self._status_text)
+
+    def _on_thumbnail_dock_visibility(self, visible):
+        """Builds the thumbnail view on first show and catches up on changes made while hidden."""
+        if not visible:
+            return
+        if self.thumbnail_view is None:
+            self._ensure_thumbnail_view()
+        elif self._thumbnails_dirty:
+            self._update_thumbnails_now()
+
+    def _ensure_thumbnail_view(self):
+        """Creates the ThumbnailView on first use and fills it if a document is open."""
+        if self.thumbnail_view is not None:
+            return self.thumbnail_view
+        self.thumbnail_view = ThumbnailView(self)
+        self.thumbnail_view.itemSelectionChanged.connect(self.on_thumbnail_selected)
+        self.thumbnail_view.page_moved.connect(self.on_page_moved)
+        self._thumbnail_layout.insertWidget(0, self.thumbnail_view)
+        if self.pdf_handler.doc:
+            self._update_thumbnails_now()
+        return self.thumbnail_view
+
+    def _thumbnails_in_sync(self):
+        """True if the thumbnail view is shown and current, so single pages can be patched in it."""
+        return self.thumbnail_view is not None and self.thumbnail_dock.isVisible() and not self._thumbnails_dirty
 
     def update_thumbnails(self):
-        """Updates the thumbnail view with pages from the current document."""
-        self.thumbnail_view.update_thumbnails(self.pdf_handler)
+        """Updates the thumbnail view, or marks it stale while the Pages dock is hidden."""
+        if not self.thumbnail_dock.isVisible():
+            self._thumbnails_dirty = True # Rebuilt by _on_thumbnail_dock_visibility
+            return
+        if self.thumbnail_view is None:
+            self._ensure_thumbnail_view() # Fills the view itself
+            return
+        self._update_thumbnails_now()
+
+    def _update_thumbnails_now(self):
+        """Re-renders all thumbnails from the current document."""
+        self._thumbnails_dirty = False
+        handler = self.pdf_handler
+        self.thumbnail_view.update_thumbnails(handler)
         # Optionally select the current page's thumbnail
-        if self.pdf_handler.doc and 0 <= self.current_page_index < self.pdf_handler.page_count:
-             items = self.thumbnail_view.findItems(f"Page {self.current_page_index + 1}", Qt.MatchFlag.MatchExactly)
-             if items:
-                 self.thumbnail_view.setCurrentItem(items[0])
+        if handler.doc and 0 <= self.current_page_index < handler.page_count:
+             self.thumbnail_view.setCurrentRow(self.current_page_index)
 
     def on_thumbnail_selected(self):
         """Slot connected to thumbnail selection changes."""
-        selected_items = self.thumbnail_view.selectedItems()
-        if selected_items:
-            page_num = selected_items[0].data(Qt.ItemDataRole.UserRole) # Retrieve stored page number
-            if page_num is not None and page_num != self.current_page_index:
-                self.display_page(page_num)
+        page_num = self.thumbnail_view.currentRow() # Rows match page numbers
+        if page_num >= 0 and page_num != self.current_page_index:
+            self.display_page(page_num)
 
     def on_page_moved(self, from_index, to_index):
         """Handles the reordering of pages from the thumbnail view."""
@@ -413,6 +716,8 @@ class MainWindow(QMainWindow):
 
     def move_selected_page(self, direction):
         """Moves the currently selected page using the reorder buttons."""
+        if self.thumbnail_view is None:
+            return
         selected_items = self.thumbnail_view.selectedItems()
         if not selected_items or not self.pdf_handler.doc:
             return
@@ -445,8 +750,10 @@ class MainWindow(QMainWindow):
 
     def next_page(self):
         """Displays the next page."""
-        if self.pdf_handler.doc and self.current_page_index < self.pdf_handler.page_count - 1:
-            self.display_page(self.current_page_index + 1)
+        handler = self.pdf_handler
+        index = self.current_page_index
+        if handler.doc and index < handler.page_count - 1:
+            self.display_page(index + 1)
             
     def first_page(self):
         """Displays the first page of the document."""
@@ -455,15 +762,19 @@ class MainWindow(QMainWindow):
             
     def last_page(self):
         """Displays the last page of the document."""
-        if self.pdf_handler.doc and self.pdf_handler.page_count > 0:
-            self.display_page(self.pdf_handler.page_count - 1)
+        handler = self.pdf_handler
+        page_count = handler.page_count
+        if handler.doc and page_count > 0:
+            self.display_page(page_count - 1)
 
     def print_pdf(self):
         """Prints the PDF file using QPrinter and QPrintDialog."""
         if not self.pdf_handler.doc:
-            print("No document open to print.")
+            logger.debug("No document open to print.")
             return
-            
+
+        # QtPrintSupport is only loaded once the user actually prints
+        from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         dialog = QPrintDialog(printer, self)
         dialog.setWindowTitle("Print Document")
@@ -495,115 +806,152 @@ class MainWindow(QMainWindow):
                 
                 # Print the document
                 self._print_document(printer, from_page, to_page)
-                print(f"Document printed successfully. Pages {from_page+1} to {to_page+1}")
-            except Exception as e:
-                print(f"Error printing document: {e}")
+                logger.info("Document printed successfully. Pages %d to %d", from_page + 1, to_page + 1)
+            except Exception:
+                logger.exception("Error printing document")
         else:
-            print("Printing canceled by user.")
+            logger.debug("Printing canceled by user.")
     
     def _print_document(self, printer, from_page, to_page):
-        """Handles the actual printing of the document."""
+        """Handles the actual printing of the document.
+
+        Pages are rendered on worker threads, at most _PRINT_PREFETCH pages
+        ahead of the one being drawn. While a page is still rendering the GUI
+        thread keeps handling events, so the progress dialog repaints and
+        Cancel takes effect without waiting for the page.
+        """
+        from PyQt6.QtGui import QPainter
+        from PyQt6.QtPrintSupport import QPrinter
         painter = QPainter()
-        if painter.begin(printer):
-            try:
-                for i in range(from_page, to_page + 1):
-                    if i > from_page:
-                        printer.newPage()
-                    
-                    # Get the page as a pixmap
-                    pixmap = self.pdf_handler.get_page_pixmap(i, scale=2.0)  # Higher resolution for printing
-                    if pixmap:
-                        # Calculate scaling to fit the page to the printer
-                        printer_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
-                        pixmap_size = pixmap.size()
-                        
-                        # Scale pixmap to fit printer page while maintaining aspect ratio
-                        scale_factor = min(printer_rect.width() / pixmap_size.width(),
-                                          printer_rect.height() / pixmap_size.height())
-                        
-                        target_width = int(pixmap_size.width() * scale_factor)
-                        target_height = int(pixmap_size.height() * scale_factor)
-                        
-                        # Center the pixmap on the page
-                        x = (printer_rect.width() - target_width) // 2
-                        y = (printer_rect.height() - target_height) // 2
-                        
-                        # Draw the pixmap on the printer
-                        painter.drawPixmap(x, y, target_width, target_height, pixmap)
-            finally:
-                painter.end()
+        if not painter.begin(printer):
+            return
+        pages = range(from_page, to_page + 1)
+        progress = QProgressDialog("Printing...", "Cancel", 0, len(pages), self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        printer_rect = printer.pageRect(QPrinter.Unit.DevicePixel)
+        page_iter = iter(pages)
+        pending = deque() # Futures of rendered pages, in print order
+
+        pool = ThreadPoolExecutor(max_workers=_PRINT_PREFETCH)
+
+        def submit_next():
+            page_num = next(page_iter, None)
+            if page_num is not None:
+                # Higher resolution for printing; drawn once, so skip the QPixmap
+                # conversion and keep print renders out of the view's cache
+                pending.append(pool.submit(self.pdf_handler.get_page_qimage, page_num, 2.0))
+
+        try:
+            for _ in range(_PRINT_PREFETCH):
+                submit_next()
+            for n in range(len(pages)):
+                future = pending.popleft()
+                while not future.done() and not progress.wasCanceled():
+                    wait((future,), timeout=_PRINT_POLL_S)
+                    QApplication.processEvents()
+                if progress.wasCanceled():
+                    printer.abort()
+                    break
+                image = future.result()
+                submit_next()
+                if n > 0:
+                    printer.newPage()
+
+                if image:
+                    # Scale image to fit printer page while maintaining aspect ratio
+                    image_size = image.size()
+                    scale_factor = min(printer_rect.width() / image_size.width(),
+                                      printer_rect.height() / image_size.height())
+
+                    target_width = int(image_size.width() * scale_factor)
+                    target_height = int(image_size.height() * scale_factor)
+
+                    # Center the image on the page
+                    x = (printer_rect.width() - target_width) // 2
+                    y = (printer_rect.height() - target_height) // 2
+
+                    # Draw the image on the printer
+                    painter.drawImage(QRect(x, y, target_width, target_height), image)
+                progress.setValue(n + 1) # Also processes events while modal
+        finally:
+            # Don't wait for a page still rendering after Cancel; it is discarded
+            pool.shutdown(wait=False, cancel_futures=True)
+            painter.end()
+            progress.close()
 
     def add_page(self):
         """Adds a new blank page after the current page."""
-        if self.pdf_handler.add_blank_page(index=self.current_page_index + 1):
-            self.update_thumbnails() # Update thumbnails
-            self.display_page(self.current_page_index + 1) # Display the new page
-            self.update_status_bar()
+        new_page_index = self.current_page_index + 1
+        if self.pdf_handler.add_blank_page(index=new_page_index):
+            self._refresh_after_mutation(new_page_index, # Display the new page
+                                         lambda view: view.insert_page(self.pdf_handler, new_page_index))
         else:
-            print("Failed to add blank page.") # TODO: Error message
+            logger.error("Failed to add blank page.") # TODO: Error message
 
     def delete_page(self):
         """Deletes the current page from the PDF file."""
         if not self.pdf_handler.doc or self.current_page_index < 0:
-             print("No page selected to delete.")
+             logger.debug("No page selected to delete.")
              return
 
+        handler = self.pdf_handler
         page_to_delete = self.current_page_index
-        page_count_before = self.pdf_handler.page_count
-
-        if self.pdf_handler.delete_page(page_to_delete):
-            self.update_thumbnails() # Update thumbnails
-            self.update_status_bar() # Update page count
 
+        if handler.delete_page(page_to_delete):
             # Decide which page to display next
-            new_page_index = -1
-            if self.pdf_handler.page_count > 0:
-                new_page_index = min(page_to_delete, self.pdf_handler.page_count - 1)
+            page_count = handler.page_count
+            new_page_index = min(page_to_delete, page_count - 1) if page_count > 0 else -1
 
-            self.display_page(new_page_index) # Display adjacent page or clear if empty
+            # Display adjacent page or clear if empty
+            self._refresh_after_mutation(new_page_index, lambda view: view.remove_page(page_to_delete))
 
         else:
-            print(f"Failed to delete page {page_to_delete}.") # TODO: Error message
-
-    def rotate_left(self):
-        """Rotates the current page 90 degrees counter-clockwise (saat yönünün tersine)."""
-        self.rotate_page(270) # 270 derece = saat yönünün tersine 90 derece
-
-    def rotate_right(self):
-        """Rotates the current page 90 degrees clockwise (saat yönünde)."""
-        self.rotate_page(90) # 90 derece = saat yönünde 90 derece
-
-    def rotate_180(self):
-        """Rotates the current page 180 degrees."""
-        self.rotate_page(180) # 180 derece = sayfayı baş aşağı çevirme
+            logger.error("Failed to delete page %d.", page_to_delete) # TODO: Error message
 
     def rotate_page(self, angle):
         """Rotates the current page by the specified angle and updates views."""
         if self.pdf_handler.doc and 0 <= self.current_page_index < self.pdf_handler.page_count:
-            if self.pdf_handler.rotate_page(self.current_page_index, angle):
-                self.display_page(self.current_page_index) # Refresh the main view
-                self.update_thumbnails() # Update all thumbnails (rotation affects them)
-                self.update_status_bar()
+            page_index = self.current_page_index
+            if self.pdf_handler.rotate_page(page_index, angle):
+                # Only the rotated page's thumbnail changed
+                self._refresh_after_mutation(page_index, lambda view: view.refresh_page(self.pdf_handler, page_index))
                 self.pdf_viewer.update() # Explicitly update the PDF viewer
             else:
-                print(f"Failed to rotate page {self.current_page_index} by {angle} degrees.") # TODO: Error msg
+                logger.error("Failed to rotate page %d by %d degrees.", self.current_page_index, angle) # TODO: Error msg
         else:
-             print("No page selected or loaded to rotate.")
+             logger.debug("No page selected or loaded to rotate.")
+
+    def _refresh_after_mutation(self, new_page_index, patch_thumbnails):
+        """Updates the thumbnails once after a page edit, then displays new_page_index.
+
+        patch_thumbnails(view) updates an in-sync thumbnail view in place; a
+        stale or hidden view is rebuilt or marked dirty instead. display_page()
+        then updates the status bar and the thumbnail selection.
+        """
+        view = self.thumbnail_view
+        # Keep on_thumbnail_selected from displaying an intermediate selection
+        with _signals_blocked(view) if view is not None else contextlib.nullcontext():
+            if self._thumbnails_in_sync():
+                patch_thumbnails(view)
+            else:
+                self.update_thumbnails()
+        self.display_page(new_page_index)
 
     def merge_pdf(self):
         """Merges another PDF into the current one."""
         if not self.pdf_handler.doc:
-             print("Open a base PDF document first before merging.") # TODO: Message box
+             logger.debug("Open a base PDF document first before merging.") # TODO: Message box
              return
 
         filepath, _ = QFileDialog.getOpenFileName(self, "Select PDF to Merge", "", "PDF Files (*.pdf)")
         if filepath:
-            if self.pdf_handler.merge_pdf(filepath):
+            if self.pdf_handler.merge_document(filepath):
                  self.update_thumbnails()
                  self.update_status_bar()
-                 print(f"Successfully merged {filepath}") # TODO: Status bar
+                 logger.info("Successfully merged %s", filepath) # TODO: Status bar
             else:
-                 print(f"Failed to merge {filepath}") # TODO: Error dialog
+                 logger.error("Failed to merge %s", filepath) # TODO: Error dialog
                  
     def merge_pdfs_in_folder(self):
         """Seçilen klasördeki PDF dosyalarını kullanıcı sırasına göre birleştirir."""
@@ -627,24 +975,19 @@ class MainWindow(QMainWindow):
                     else:
                         QMessageBox.warning(self, "Birleştirme", f"Açılamadı: {pdf_paths[0]}")
                         return
-                merged_count = 0
-                for path in pdf_paths[start_index:]:
-                    if self.pdf_handler.merge_pdf(path):
-                        merged_count += 1
-                    else:
-                        print(f"Merge failed: {path}")
+                merged_count = self.pdf_handler.merge_documents(pdf_paths[start_index:])
                 # UI güncelle
                 self.update_thumbnails()
                 self.update_status_bar()
                 QMessageBox.information(self, "Birleştirme Tamamlandı", 
                                           f"{len(pdf_paths)} dosyadan {merged_count + (1 if start_index==1 else 0)} dosya birleştirildi.")
-        except Exception as e:
-            print(f"merge_pdfs_in_folder error: {e}")
+        except Exception:
+            logger.exception("merge_pdfs_in_folder error")
 
     def split_pdf(self):
         """Splits the current PDF into separate files based on user selection."""
         if not self.pdf_handler.doc:
-            print("PDF bölmek için önce bir PDF dosyası açın.") # TODO: Message box
+            logger.debug("PDF bölmek için önce bir PDF dosyası açın.") # TODO: Message box
             return
             
         # Import the split dialog
@@ -657,22 +1000,22 @@ class MainWindow(QMainWindow):
             output_dir = dialog.output_dir
             page_ranges = dialog.get_page_ranges()
             
-            # Split the PDF
-            created_files = self.pdf_handler.split_pdf(output_dir, page_ranges)
+            # Split the PDF; output files are written by up to 4 worker processes
+            success, message = self.pdf_handler.split_pdf(output_dir, page_ranges is None, page_ranges,
+                                                          workers=min(os.cpu_count() or 1, 4))
             
-            if created_files:
+            if success:
                 # Show success message with the number of created files
                 from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.information(self, "PDF Bölme Başarılı", 
-                                      f"{len(created_files)} PDF dosyası oluşturuldu.\n\nKonum: {output_dir}")
+                                      f"{message}\n\nKonum: {output_dir}")
                 
                 # Update status bar
-                self.status_bar.showMessage(f"{len(created_files)} PDF dosyası oluşturuldu.")
+                self.status_bar.showMessage(message)
             else:
                 # Show error message
                 from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "PDF Bölme Başarısız", 
-                                  "PDF dosyası bölünürken bir hata oluştu.")
+                QMessageBox.warning(self, "PDF Bölme Başarısız", message)
                 
                 # Update status bar
                 self.status_bar.showMessage("PDF bölme işlemi başarısız oldu.")
@@ -691,86 +1034,85 @@ class MainWindow(QMainWindow):
         self.pdf_viewer.zoom_width()
 
     # --- Theme handling ---
+    def _icon_cache_stamp(self, icons_dir):
+        """Returns a digest that changes when the source SVGs, qt_material or the theme list change."""
+        svg_mtime = max((entry.stat().st_mtime for entry in os.scandir(icons_dir)
+                         if entry.is_file() and entry.name.endswith('.svg')), default=0)
+        stamp = hashlib.blake2b(digest_size=16)
+        stamp.update(repr((getattr(qt_material, '__version__', ''), svg_mtime, _THEMES)).encode())
+        return stamp.hexdigest()
+
     def _prepare_themed_icons(self):
-        """Uygulama başlangıcında tüm temalar için SVG ikonlarını hazırlar."""
+        """Uygulama başlangıcında geçerli tema için SVG ikonlarını hazırlar.
+
+        Icons are regenerated only when the stamp saved in settings is stale;
+        other themes are built on demand by apply_theme().
+        """
+        self._fresh_icon_themes = set()
         try:
-            import logging
-            # Tema hazırlığı sırasında qt_material'den gelen yoğun uyarıları sustur
-            logging.getLogger().setLevel(logging.ERROR)
-            
-            from gui.svg_utils import create_themed_icons
             icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
-            
-            # Tema dizinlerini kontrol et, yoksa oluştur
-            create_themed_icons(icons_dir)
-            
+            stamp = self._icon_cache_stamp(icons_dir)
+            if self.settings.value("iconCacheStamp") == stamp:
+                # Themes whose icons were generated under the current stamp
+                fresh = self.settings.value("iconCacheThemes", "")
+                if isinstance(fresh, str): # Some QSettings backends already return a list
+                    fresh = fresh.split(",")
+                self._fresh_icon_themes = set(filter(None, fresh))
+            else:
+                self.settings.setValue("iconCacheStamp", stamp)
+            self._ensure_themed_icons(self.current_theme)
+        except Exception:
+            logger.exception("Tema bazlı SVG ikonları hazırlanırken hata oluştu")
+
+    def _ensure_themed_icons(self, theme_name):
+        """Creates the SVG icons of theme_name unless they are already up to date."""
+        icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
+        if theme_name in self._fresh_icon_themes and os.path.isdir(os.path.join(icons_dir, theme_name)):
+            return
+        from gui.svg_utils import create_themed_icons
+        logger.debug("Tema için ikon dizini oluşturuluyor: %s", theme_name)
+        # Tema hazırlığı sırasında qt_material'den gelen yoğun uyarıları sustur
+        logging.getLogger().setLevel(logging.ERROR)
+        try:
+            create_themed_icons(icons_dir, [theme_name])
+        finally:
             # Log seviyesini normale döndür
             logging.getLogger().setLevel(logging.WARNING)
-        except Exception as e:
-            print(f"Tema bazlı SVG ikonları hazırlanırken hata oluştu: {e}")
+        self._fresh_icon_themes.add(theme_name)
+        self.settings.setValue("iconCacheThemes", ",".join(sorted(self._fresh_icon_themes)))
             
     # _update_toolbar_icons metodu kaldırıldı ve toolbar_manager.py'deki update_button_icons metodu kullanılıyor
     
+    def _schedule_theme(self, theme_name):
+        """Applies theme_name once the combo box has settled for a moment."""
+        self._pending_theme = theme_name
+        self._theme_timer.start() # Restarts the countdown if already running
+
     def apply_theme(self, theme_name):
         """Applies the selected qt-material theme and updates SVG icons."""
-        print(f"--- Applying theme: {theme_name} ---")
+        logger.debug("Applying theme: %s", theme_name)
         try:
-            # Construct full path to the theme file
-            qt_material_path = qt_material.__path__[0]
-            theme_file_path = os.path.join(qt_material_path, 'themes', f"{theme_name}.xml")
-
-            print(f"Attempting to apply theme file path: {theme_file_path}")
-            if os.path.exists(theme_file_path):
-                apply_stylesheet(self.app, theme=theme_file_path) # Pass full path
-                print(f"qt_material.apply_stylesheet called with path: {theme_file_path}")
-            else:
-                print(f"ERROR: Theme file not found at {theme_file_path}")
+            if not apply_theme_stylesheet(self.app, theme_name):
                 return # Don't proceed if file not found
 
-            # Tema verilerini al ve ikon temasını ayarla (get_theme uses name without extension)
-            try:
-                theme_data = get_theme(theme_name)
-                if theme_data and 'icon_theme' in theme_data:
-                    print(f"Setting icon theme: {theme_data['icon_theme']}") # Debug print
-                    set_icons_theme(theme_data['icon_theme'])
-                    
-                    # Tema değiştiğinde önceden hazırlanmış tema bazlı SVG ikonlarını kullanacağız
-                    # İlk çalıştırmada, eğer tema bazlı ikonlar oluşturulmamışsa oluşturalım
-                    from gui.svg_utils import create_themed_icons
-                    icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
-                    
-                    # Tema dizinlerini kontrol et, yoksa oluştur
-                    theme_dir = os.path.join(icons_dir, theme_name)
-                    if not os.path.exists(theme_dir):
-                        print(f"Tema için ikon dizini oluşturuluyor: {theme_name}")
-                        create_themed_icons(icons_dir)
-                else:
-                    # If no specific icon theme is defined, don't call set_icons_theme.
-                    # Let qt-material handle defaults based on the main theme.
-                    print(f"No specific icon theme found for {theme_name}. Skipping explicit icon theme setting.") # Debug print
-            except Exception as theme_error:
-                # If getting theme data fails, don't call set_icons_theme.
-                print(f"Error getting theme data: {theme_error}. Skipping explicit icon theme setting.")
-            
-            # Tema ayarlarını kaydet
-            self.current_theme = theme_name
-            self.settings.setValue("theme", theme_name)
-            print(f"Theme successfully set to: {theme_name}") # Debug print
+            # Başlangıçta yalnızca geçerli temanın ikonları hazırlanır;
+            # bu temanınkiler eksik ya da eskiyse şimdi oluşturalım
+            self._ensure_themed_icons(theme_name)
+
+            # Seçili temayı güncelle
+            self.current_theme = theme_name # Written to settings in closeEvent
+            logger.debug("Theme successfully set to: %s", theme_name)
             
-            # Toolbar butonlarının ikonlarını güncelle
-            self.toolbar_manager.update_button_icons(theme_name)
+            # Toolbar butonlarının ikonlarını güncelle; on the next event loop
+            # pass, so the new stylesheet is painted before the icons change
+            QTimer.singleShot(0, functools.partial(self.toolbar_manager.update_button_icons, theme_name))
             
-            # Arayüzü yenile (Repolish deneyelim)
-            # self.update() # update() yeterli olmayabilir
-            self.style().unpolish(self)
+            # Arayüzü yenile; polish() alone picks up the new stylesheet
             self.style().polish(self)
-            # Ayrıca uygulama genelinde stilin yenilenmesini tetikleyebiliriz
-            self.app.processEvents() # Olay döngüsünü işleterek güncellemelerin görünmesini sağla
-            print(f"Theme application finished for: {theme_name}") # Bitiş logu
-        except Exception as e:
-            print(f"ERROR applying theme {theme_name}: {e}") # Catch and print any exception
-            import traceback
-            traceback.print_exc() # Print full traceback for detailed error info
+            # Repaint happens when control returns to the event loop
+            logger.debug("Theme application finished for: %s", theme_name) # Bitiş logu
+        except Exception:
+            logger.exception("Error applying theme %s", theme_name) # Logs the full traceback
 
     def on_annotation_selected(self, annot_type, props):
         """Update properties bar when an annotation is selected."""
@@ -788,10 +1130,15 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     # --- Edit Toolbar Actions ---
+    def _edit_mode_requested(self, mode):
+        """True if mode should be switched on; a menu shortcut can fire before the edit toolbar exists."""
+        button = self.edit_buttons.get(mode)
+        return button is None or button.isChecked()
+
     def select_tool(self):
         """Enable selection mode."""
         if self._check_doc_open():
-            if self.edit_buttons["select"].isChecked():
+            if self._edit_mode_requested("select"):
                 self.pdf_viewer.set_annotation_mode("select")
                 self.status_bar.showMessage("Değiştirmek veya silmek için bir nesne seçin.")
                 self._update_edit_buttons("select")
@@ -802,7 +1149,7 @@ class MainWindow(QMainWindow):
     def add_note(self):
         """Enable note adding mode."""
         if self._check_doc_open():
-            if self.edit_buttons["note"].isChecked():
+            if self._edit_mode_requested("note"):
                 self.pdf_viewer.set_annotation_mode("note")
                 self.status_bar.showMessage("Not eklemek için tıklayın.")
                 self._update_edit_buttons("note")
@@ -813,7 +1160,7 @@ class MainWindow(QMainWindow):
     def add_text(self):
         """Enable text adding mode."""
         if self._check_doc_open():
-            if self.edit_buttons["text"].isChecked():
+            if self._edit_mode_requested("text"):
                 self.pdf_viewer.set_annotation_mode("text")
                 self.status_bar.showMessage("Metin eklemek için tıklayıp sürükleyin veya tıklayın.")
                 self._update_edit_buttons("text")
@@ -824,7 +1171,7 @@ class MainWindow(QMainWindow):
     def add_line(self):
         """Enable line adding mode."""
         if self._check_doc_open():
-            if self.edit_buttons["line"].isChecked():
+            if self._edit_mode_requested("line"):
                 self.pdf_viewer.set_annotation_mode("line")
                 self.status_bar.showMessage("Çizgi eklemek için tıklayıp sürükleyin.")
                 self._update_edit_buttons("line")
@@ -835,7 +1182,7 @@ class MainWindow(QMainWindow):
     def highlight(self):
         """Enable highlight mode."""
         if self._check_doc_open():
-            if self.edit_buttons["highlight"].isChecked():
+            if self._edit_mode_requested("highlight"):
                 self.pdf_viewer.set_annotation_mode("highlight")
                 self.status_bar.showMessage("Vurgulamak için metni seçin.")
                 self._update_edit_buttons("highlight")
@@ -846,7 +1193,7 @@ class MainWindow(QMainWindow):
     def add_circle(self):
         """Enable circle adding mode."""
         if self._check_doc_open():
-            if self.edit_buttons["circle"].isChecked():
+            if self._edit_mode_requested("circle"):
                 self.pdf_viewer.set_annotation_mode("circle")
                 self.status_bar.showMessage("Çember eklemek için tıklayıp sürükleyin.")
                 self._update_edit_buttons("circle")
@@ -857,7 +1204,7 @@ class MainWindow(QMainWindow):
     def add_stamp(self):
         """Enable stamp adding mode."""
         if self._check_doc_open():
-            if self.edit_buttons["stamp"].isChecked():
+            if self._edit_mode_requested("stamp"):
                 self.pdf_viewer.set_annotation_mode("stamp")
                 self.status_bar.showMessage("Damga (ONAYLANDI) eklemek için tıklayın.")
                 self._update_edit_buttons("stamp")
@@ -875,14 +1222,13 @@ class MainWindow(QMainWindow):
         
         for mode, button in self.edit_buttons.items():
             if mode != active_mode:
-                button.blockSignals(True)
-                button.setChecked(False)
-                button.blockSignals(False)
+                with _signals_blocked(button):
+                    button.setChecked(False)
 
     def _check_doc_open(self):
         """Helper to check if a document is open."""
         if not self.pdf_handler or not self.pdf_handler.doc:
-            print("Lütfen önce bir PDF dosyası açın.")
+            logger.debug("Lütfen önce bir PDF dosyası açın.")
             self.status_bar.showMessage("Hata: PDF dosyası açık değil.")
             return False
         return True
@@ -910,7 +1256,8 @@ class MainWindow(QMainWindow):
         self.settings.setValue("windowState", self.saveState())
         # Use the correct attribute name from PDFViewer
         self.settings.setValue("zoomScale", self.pdf_viewer.current_scale) # Save current zoom scale
-        self.settings.setValue("theme", self.current_theme) # Ensure theme is saved (redundant but safe)
+        self.settings.setValue("theme", self.current_theme)
+        self.settings.sync() # Write all changed preferences in one go
 
         self.pdf_handler.close_document() # Ensure document is closed
         super().closeEvent(event)
@@ -919,6 +1266,14 @@ class MainWindow(QMainWindow):
         """Creates the status bar."""
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("Ready")
+        self._status_key = () # Never equal to a real key, see _do_update_status_bar
+        self._status_text = ""
+        self._status_scheduled_msg = ""
+        # Holding PgDown would otherwise reformat the texts once per key repeat
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(_PAGE_DEBOUNCE_MS) # Lands together with the page itself
+        self._status_timer.timeout.connect(self._do_update_status_bar)
 
 # Example usage for testing this window directly (optional)
 if __name__ == '__main__':
@@ -3,10 +3,23 @@ from PyQt6.QtGui import QPixmap, QImage, QCursor, QPainter, QPen, QColor, QPolyg
 from PyQt6.QtCore import Qt, QPoint, QPointF, pyqtSignal, QRectF
 import fitz
 import re
+import logging
+import contextlib
+from functools import partial, wraps
 
 from core.pdf_handler import PDFHandler # Import PDFHandler for type hinting
 from gui.note_item import NoteItem # Import the NoteItem class
 
+logger = logging.getLogger(__name__)
+
+def _with_doc_lock(method):
+    """Runs a PDFViewer method that uses fitz objects while holding the document lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._locked_doc():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
     """Widget to display a PDF page within a scrollable area."""
     
@@ -41,6 +54,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         self.pdf_handler: PDFHandler | None = None
         self.current_page_index: int = -1
         self.current_fitz_page = None # Keep the fitz.Page object alive for annotations
+        self._render_token = 0 # Bumped per render request; stale async results are dropped
         
         # Note related attributes
         self.notes = []  # List to store note markers on the current page
@@ -99,6 +113,10 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.installEventFilter(self)
 
+    def _locked_doc(self):
+        """Returns a context manager holding PDFHandler.doc_lock; a no-op while no document is shown."""
+        return self.pdf_handler.doc_lock if self.pdf_handler else contextlib.nullcontext()
+
     def display_page(self, pdf_handler: PDFHandler, page_index: int):
         """Display the given PDF page using the handler."""
         # Clear existing temporary markers when changing pages
@@ -106,21 +124,33 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         
         self.pdf_handler = pdf_handler
         self.current_page_index = page_index
-        self.current_fitz_page = self.pdf_handler.doc[page_index] if self.pdf_handler.doc else None
+        self.current_fitz_page = self.pdf_handler.get_page(page_index) if self.pdf_handler.doc else None
         self.overscroll_delta = 0
         self.image_label.move(0, 0)
 
-        pixmap = self.pdf_handler.get_page_pixmap(self.current_page_index, scale=self.current_scale)
+        # Rendered off the GUI thread; cached pages come back immediately
+        self._render_token += 1
+        self.pdf_handler.render_page_async(page_index, scale=self.current_scale,
+                                           callback=partial(self._on_page_rendered, self._render_token))
 
+    def _on_page_rendered(self, token, page_index, pixmap):
+        """Shows a page rendered by display_page, unless the view has moved on since."""
+        if token != self._render_token:
+            return
         if pixmap:
             self.current_pixmap = pixmap
             self.image_label.setPixmap(self.current_pixmap)
+            # Render the neighbouring pages while the user reads this one,
+            # but not while an annotation edit needs the document lock
+            if not (self.is_dragging_annot or self.is_resizing):
+                self.pdf_handler.prefetch(page_index, scale=self.current_scale)
         else:
             self.clear_display()
             self.image_label.setText(f"Error loading page {page_index + 1}.")
 
     def clear_display(self):
         """Clears the currently displayed page."""
+        self._render_token += 1 # Drop any render still in flight
         self.image_label.clear()
         self.image_label.setText("No PDF loaded or page selected.")
         self.current_pixmap = None
@@ -129,29 +159,40 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         self.current_fitz_page = None
         self.current_scale = 1.0
 
-    def update_display(self):
-        """Re-renders the current page and updates the image label."""
-        if self.pdf_handler and self.current_page_index >= 0:
-            # Re-bind selection if it exists using xref to prevent ReferenceError
-            old_xref = None
-            try:
-                if self.selected_annot:
-                    old_xref = self.selected_annot.xref
-            except:
-                pass
+    def update_display(self, invalidate=True):
+        """Re-renders the current page and updates the image label.
 
-            self.current_fitz_page = self.pdf_handler.doc[self.current_page_index] if self.pdf_handler.doc else None
-            
-            if old_xref and self.current_fitz_page:
-                self.selected_annot = None
+        Args:
+            invalidate: Drop the page's cached renderings first, because its
+                        content changed. Zooming passes False so renderings at
+                        other scales and the parsed page can be reused.
+        """
+        if self.pdf_handler and self.current_page_index >= 0:
+            # The rendering below takes the lock itself; only the re-binding needs it here
+            with self._locked_doc():
+                # Re-bind selection if it exists using xref to prevent ReferenceError
+                old_xref = None
                 try:
-                    for annot in self.current_fitz_page.annots():
-                        if annot.xref == old_xref:
-                            self.selected_annot = annot
-                            break
-                except Exception as e:
-                    print(f"Error re-binding annotation: {e}")
+                    if self.selected_annot:
+                        old_xref = self.selected_annot.xref
+                except:
+                    pass
+
+                self.current_fitz_page = self.pdf_handler.get_page(self.current_page_index) if self.pdf_handler.doc else None
+
+                if old_xref and self.current_fitz_page:
+                    self.selected_annot = None
+                    try:
+                        for annot in self.current_fitz_page.annots():
+                            if annot.xref == old_xref:
+                                self.selected_annot = annot
+                                break
+                    except Exception as e:
+                        logger.error("Error re-binding annotation: %s", e)
 
+            self._render_token += 1 # Rendered synchronously below; drop older async results
+            if invalidate: # The page content changed, so don't reuse a cached rendering
+                self.pdf_handler.invalidate_pixmaps(self.current_page_index)
             pixmap = self.pdf_handler.get_page_pixmap(self.current_page_index, scale=self.current_scale)
             if pixmap:
                 self.current_pixmap = pixmap
@@ -195,6 +236,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             self.apply_properties_to_annot(self.selected_annot)
             self.update_display()
 
+    @_with_doc_lock
     def apply_properties_to_annot(self, annot):
         """Applies current properties to a fitz.Annot object."""
         try:
@@ -254,8 +296,9 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             if "weakly-referenced" in str(e) or "ReferenceError" in str(type(e)):
                 self.selected_annot = None
             else:
-                print(f"Error applying properties to annotation: {e}")
+                logger.error("Error applying properties to annotation: %s", e)
 
+    @_with_doc_lock
     def get_annot_properties(self, annot):
         """Extracts current properties from a fitz.Annot object."""
         props = self.current_properties.copy()
@@ -324,7 +367,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                     props["arrow_type"] = "none"
                     
         except Exception as e:
-            print(f"Error getting properties from annotation: {e}")
+            logger.error("Error getting properties from annotation: %s", e)
         
         return props
 
@@ -342,8 +385,9 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         from PyQt6.QtGui import QAction
         
         menu = QMenu(self)
-        annot_type = annot.type[0]
-        annot_type_name = annot.type[1]
+        with self._locked_doc(): # Not held while the menu runs its own event loop
+            annot_type = annot.type[0]
+            annot_type_name = annot.type[1]
         
         # Common actions
         delete_action = menu.addAction("Sil")
@@ -368,6 +412,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         
         menu.exec(global_pos)
     
+    @_with_doc_lock
     def delete_annotation(self, annot):
         """Deletes the given annotation."""
         try:
@@ -378,22 +423,25 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             self.update_display()
             self.parent_window.status_bar.showMessage("Nesne silindi.")
         except Exception as e:
-            print(f"Error deleting annotation: {e}")
+            logger.error("Error deleting annotation: %s", e)
     
     def edit_freetext(self, annot):
         """Opens a dialog to edit FreeText content."""
         from PyQt6.QtWidgets import QInputDialog
-        current_text = annot.info.get("content", "")
+        with self._locked_doc():
+            current_text = annot.info.get("content", "")
         new_text, ok = QInputDialog.getText(self, "Metni Düzenle", "Yeni metin:", text=current_text)
         if ok and new_text:
             try:
-                annot.set_info(content=new_text)
-                annot.update()
+                with self._locked_doc():
+                    annot.set_info(content=new_text)
+                    annot.update()
                 self.pdf_handler.modified = True
                 self.update_display()
             except Exception as e:
-                print(f"Error editing text: {e}")
+                logger.error("Error editing text: %s", e)
     
+    @_with_doc_lock
     def set_line_arrow(self, annot, arrow_type):
         """Sets the arrow type for a line annotation."""
         try:
@@ -409,8 +457,9 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             self.pdf_handler.modified = True
             self.update_display()
         except Exception as e:
-            print(f"Error setting arrow type: {e}")
+            logger.error("Error setting arrow type: %s", e)
     
+    @_with_doc_lock
     def toggle_fill(self, annot):
         """Toggles fill color on/off for shape annotations."""
         try:
@@ -425,8 +474,9 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             self.pdf_handler.modified = True
             self.update_display()
         except Exception as e:
-            print(f"Error toggling fill: {e}")
+            logger.error("Error toggling fill: %s", e)
     
+    @_with_doc_lock
     def reflow_freetext_annotation(self, annot):
         """Re-creates a FreeText annotation to reflow text to the new rect."""
         try:
@@ -472,7 +522,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             self.pdf_handler.modified = True
             
         except Exception as e:
-            print(f"Error reflowing text: {e}")
+            logger.error("Error reflowing text: %s", e)
 
     # --- Event Handling ---
     def eventFilter(self, obj, event):
@@ -488,66 +538,69 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                         fitz_point = fitz.Point((screen_pos.x() - offset_x) / self.current_scale, 
                                                (screen_pos.y() - offset_y) / self.current_scale)
                         
-                        # Check if clicking on a resize handle first
-                        # Skip resize for line-like annotations (they use vertices, not rect)
-                        is_line_like = self.selected_annot and self.selected_annot.type[0] in [3, 4, 7, 8]
-                        if self.selected_annot and not is_line_like and hasattr(self, 'handle_rects') and self.handle_rects:
-                            for i, hr in enumerate(self.handle_rects):
-                                if hr.contains(QPointF(screen_pos)):
-                                    self.active_resize_handle = i
-                                    self.is_resizing = True
-                                    self.resize_start_rect = fitz.Rect(self.selected_annot.rect)
-                                    self.drag_start_pdf_pos = fitz_point
-                                    return True
+                        with self._locked_doc():
+                            # Check if clicking on a resize handle first
+                            # Skip resize for line-like annotations (they use vertices, not rect)
+                            is_line_like = self.selected_annot and self.selected_annot.type[0] in [3, 4, 7, 8]
+                            if self.selected_annot and not is_line_like and hasattr(self, 'handle_rects') and self.handle_rects:
+                                for i, hr in enumerate(self.handle_rects):
+                                    if hr.contains(QPointF(screen_pos)):
+                                        self.active_resize_handle = i
+                                        self.is_resizing = True
+                                        self.pdf_handler.cancel_prefetch() # Keep the lock free for set_rect
+                                        self.resize_start_rect = fitz.Rect(self.selected_annot.rect)
+                                        self.drag_start_pdf_pos = fitz_point
+                                        return True
                         
-                        # Prioritize existing selection for dragging
-                        already_hit = False
-                        if self.selected_annot:
-                            try:
-                                if fitz_point in self.selected_annot.rect:
-                                    already_hit = True
-                            except:
-                                self.selected_annot = None
-
-                        if not already_hit:
-                            # Search for new selection (reverse search to pick topmost)
-                            old_selected = self.selected_annot
-                            self.selected_annot = None
-                            if self.current_fitz_page:
+                            # Prioritize existing selection for dragging
+                            already_hit = False
+                            if self.selected_annot:
                                 try:
-                                    annots = list(self.current_fitz_page.annots())
-                                    for annot in reversed(annots):
-                                        if fitz_point in annot.rect:
-                                            self.selected_annot = annot
-                                            break
-                                except Exception as e:
-                                    print(f"Error accessing annotations: {e}")
+                                    if fitz_point in self.selected_annot.rect:
+                                        already_hit = True
+                                except:
+                                    self.selected_annot = None
+
+                            if not already_hit:
+                                # Search for new selection (reverse search to pick topmost)
+                                old_selected = self.selected_annot
+                                self.selected_annot = None
+                                if self.current_fitz_page:
+                                    try:
+                                        annots = list(self.current_fitz_page.annots())
+                                        for annot in reversed(annots):
+                                            if fitz_point in annot.rect:
+                                                self.selected_annot = annot
+                                                break
+                                    except Exception as e:
+                                        logger.error("Error accessing annotations: %s", e)
                             
-                            # Emit deselect if we had something and now don't
-                            if old_selected and not self.selected_annot:
-                                self.annotation_deselected.emit()
+                                # Emit deselect if we had something and now don't
+                                if old_selected and not self.selected_annot:
+                                    self.annotation_deselected.emit()
                         
-                        if self.selected_annot:
-                            # Emit properties to update bars
-                            self.annotation_selected.emit(
-                                self.selected_annot.type[1], 
-                                self.get_annot_properties(self.selected_annot)
-                            )
-                            # Prepare for dragging
-                            self.is_dragging_annot = True
-                            self.drag_start_pdf_pos = fitz_point
-                            self.drag_displacement_pdf = (0, 0)
-                            self.original_annot_rect = fitz.Rect(self.selected_annot.rect)
-                            if self.selected_annot.type[0] in [3, 4, 7, 8]: # Line, PolyLine, PolyLine(7), Polygon
-                                self.original_vertices = list(self.selected_annot.vertices)
-                            else:
-                                self.original_vertices = None
+                            if self.selected_annot:
+                                # Emit properties to update bars
+                                self.annotation_selected.emit(
+                                    self.selected_annot.type[1], 
+                                    self.get_annot_properties(self.selected_annot)
+                                )
+                                # Prepare for dragging
+                                self.is_dragging_annot = True
+                                self.pdf_handler.cancel_prefetch() # Keep the lock free for the final move
+                                self.drag_start_pdf_pos = fitz_point
+                                self.drag_displacement_pdf = (0, 0)
+                                self.original_annot_rect = fitz.Rect(self.selected_annot.rect)
+                                if self.selected_annot.type[0] in [3, 4, 7, 8]: # Line, PolyLine, PolyLine(7), Polygon
+                                    self.original_vertices = list(self.selected_annot.vertices)
+                                else:
+                                    self.original_vertices = None
 
-                            try:
-                                annot_type = self.selected_annot.type[1]
-                                self.parent_window.status_bar.showMessage(f"Seçildi: {annot_type} (Taşımak için sürükleyin, köşelerden boyutlandırın)")
-                            except Exception:
-                                self.parent_window.status_bar.showMessage("Nesne seçildi.")
+                                try:
+                                    annot_type = self.selected_annot.type[1]
+                                    self.parent_window.status_bar.showMessage(f"Seçildi: {annot_type} (Taşımak için sürükleyin, köşelerden boyutlandırın)")
+                                except Exception:
+                                    self.parent_window.status_bar.showMessage("Nesne seçildi.")
                         
                         self.image_label.update()
                         return True
@@ -568,16 +621,17 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                                                (screen_pos.y() - offset_y) / self.current_scale)
                         
                         # Find annotation at click position
-                        clicked_annot = None
-                        if self.current_fitz_page:
-                            try:
-                                annots = list(self.current_fitz_page.annots())
-                                for annot in reversed(annots):
-                                    if fitz_point in annot.rect:
-                                        clicked_annot = annot
-                                        break
-                            except Exception as e:
-                                print(f"Error finding annotation for context menu: {e}")
+                        with self._locked_doc():
+                            clicked_annot = None
+                            if self.current_fitz_page:
+                                try:
+                                    annots = list(self.current_fitz_page.annots())
+                                    for annot in reversed(annots):
+                                        if fitz_point in annot.rect:
+                                            clicked_annot = annot
+                                            break
+                                except Exception as e:
+                                    logger.error("Error finding annotation for context menu: %s", e)
                         
                         if clicked_annot:
                             self.selected_annot = clicked_annot
@@ -636,15 +690,16 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                         else:
                             new_rect.y1 = new_rect.y0 + 10
                     
-                    try:
-                        # Skip set_rect for line-like annotations
-                        is_line_like = self.selected_annot.type[0] in [3, 4, 7, 8]
-                        if not is_line_like:
-                            self.selected_annot.set_rect(new_rect)
-                            self.selected_annot.update()
-                            self.pdf_handler.modified = True
-                    except Exception as e:
-                        print(f"Resize error: {e}")
+                    with self._locked_doc():
+                        try:
+                            # Skip set_rect for line-like annotations
+                            is_line_like = self.selected_annot.type[0] in [3, 4, 7, 8]
+                            if not is_line_like:
+                                self.selected_annot.set_rect(new_rect)
+                                self.selected_annot.update()
+                                self.pdf_handler.modified = True
+                        except Exception as e:
+                            logger.error("Resize error: %s", e)
                     
                     self.update_display()
                     return True
@@ -659,24 +714,9 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                     dx = current_pdf_point.x - self.drag_start_pdf_pos.x
                     dy = current_pdf_point.y - self.drag_start_pdf_pos.y
                     self.drag_displacement_pdf = (dx, dy)
-                    
-                    try:
-                        # Safety check for dead object
-                        _ = self.selected_annot.rect
 
-                        # Calculate displacement in PDF units from original position
-                        new_rect = fitz.Rect(self.original_annot_rect.x0 + dx, self.original_annot_rect.y0 + dy,
-                                            self.original_annot_rect.x1 + dx, self.original_annot_rect.y1 + dy)
-                        
-                        # Handle line-like annotations separately - they don't support set_rect
-                        is_line_like = self.selected_annot.type[0] in [3, 4, 7, 8] # Line, PolyLine, Polygon
-                        
-                        # Don't call set_rect during drag - just update visual
-                        # The actual move happens on MouseRelease
-                    except:
-                        # If object died, clear selection
-                        pass
-                    
+                    # Don't call set_rect during drag - the actual move happens on
+                    # MouseRelease, so moving the mouse needs no document access.
                     # Only update visual feedback (selection frame shows displacement)
                     self.image_label.update()
                     return True
@@ -699,7 +739,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                         try:
                             self.reflow_freetext_annotation(self.selected_annot)
                         except Exception as e:
-                            print(f"Error during text reflow: {e}")
+                            logger.error("Error during text reflow: %s", e)
                     
                     self.resize_start_rect = None
                     self.update_display()
@@ -708,55 +748,56 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
                 if self.is_dragging_annot:
                     self.is_dragging_annot = False
                     dx, dy = self.drag_displacement_pdf
-                    if abs(dx) > 0.1 or abs(dy) > 0.1:
-                        # Perform final move for line-like if needed
-                        if self.selected_annot.type[0] in [3, 4, 7]: # Line, PolyLine
-                            try:
-                                # Re-create the line at the new position
-                                if self.original_vertices:
-                                    new_vertices = []
-                                    for v in self.original_vertices:
-                                        vx = v.x if hasattr(v, "x") else v[0]
-                                        vy = v.y if hasattr(v, "y") else v[1]
-                                        new_vertices.append((vx + dx, vy + dy))
+                    with self._locked_doc():
+                        if abs(dx) > 0.1 or abs(dy) > 0.1:
+                            # Perform final move for line-like if needed
+                            if self.selected_annot.type[0] in [3, 4, 7]: # Line, PolyLine
+                                try:
+                                    # Re-create the line at the new position
+                                    if self.original_vertices:
+                                        new_vertices = []
+                                        for v in self.original_vertices:
+                                            vx = v.x if hasattr(v, "x") else v[0]
+                                            vy = v.y if hasattr(v, "y") else v[1]
+                                            new_vertices.append((vx + dx, vy + dy))
                                     
-                                    # Copy properties
-                                    colors = self.selected_annot.colors
-                                    width = self.selected_annot.border.get("width", 1)
-                                    info = self.selected_annot.info
-                                    opacity = self.selected_annot.opacity
+                                        # Copy properties
+                                        colors = self.selected_annot.colors
+                                        width = self.selected_annot.border.get("width", 1)
+                                        info = self.selected_annot.info
+                                        opacity = self.selected_annot.opacity
                                     
-                                    # Remove old
-                                    self.current_fitz_page.delete_annot(self.selected_annot)
+                                        # Remove old
+                                        self.current_fitz_page.delete_annot(self.selected_annot)
                                     
-                                    # Add new (as polyline)
-                                    new_annot = self.current_fitz_page.add_polyline_annot(new_vertices)
-                                    new_annot.set_colors(stroke=colors.get("stroke"), fill=colors.get("fill"))
-                                    new_annot.set_border(width=width)
-                                    new_annot.set_info(info)
-                                    new_annot.set_opacity(opacity)
+                                        # Add new (as polyline)
+                                        new_annot = self.current_fitz_page.add_polyline_annot(new_vertices)
+                                        new_annot.set_colors(stroke=colors.get("stroke"), fill=colors.get("fill"))
+                                        new_annot.set_border(width=width)
+                                        new_annot.set_info(info)
+                                        new_annot.set_opacity(opacity)
                                     
-                                    # Update
-                                    new_annot.update()
-                                    self.selected_annot = new_annot
-                            except Exception as e:
-                                print(f"Error moving line: {e}")
-                        else:
-                            # For non-line annotations (Circle, Square, FreeText, etc.)
-                            # Apply the final move now
-                            try:
-                                new_rect = fitz.Rect(
-                                    self.original_annot_rect.x0 + dx, 
-                                    self.original_annot_rect.y0 + dy,
-                                    self.original_annot_rect.x1 + dx, 
-                                    self.original_annot_rect.y1 + dy
-                                )
-                                self.selected_annot.set_rect(new_rect)
-                                self.selected_annot.update()
-                            except Exception as e:
-                                print(f"Error moving annotation: {e}")
+                                        # Update
+                                        new_annot.update()
+                                        self.selected_annot = new_annot
+                                except Exception as e:
+                                    logger.error("Error moving line: %s", e)
+                            else:
+                                # For non-line annotations (Circle, Square, FreeText, etc.)
+                                # Apply the final move now
+                                try:
+                                    new_rect = fitz.Rect(
+                                        self.original_annot_rect.x0 + dx, 
+                                        self.original_annot_rect.y0 + dy,
+                                        self.original_annot_rect.x1 + dx, 
+                                        self.original_annot_rect.y1 + dy
+                                    )
+                                    self.selected_annot.set_rect(new_rect)
+                                    self.selected_annot.update()
+                                except Exception as e:
+                                    logger.error("Error moving annotation: %s", e)
                         
-                        self.pdf_handler.modified = True
+                            self.pdf_handler.modified = True
                     
                     self.drag_start_pdf_pos = None
                     self.drag_displacement_pdf = (0, 0)
@@ -796,7 +837,8 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         if event.type() == event.Type.KeyPress:
             if event.key() == Qt.Key.Key_Delete and self.selected_annot:
                 # Remove the selected annotation
-                self.pdf_handler.doc[self.current_page_index].delete_annot(self.selected_annot)
+                with self._locked_doc():
+                    self.current_fitz_page.delete_annot(self.selected_annot)
                 self.pdf_handler.modified = True
                 self.selected_annot = None
                 self.update_display()
@@ -817,7 +859,14 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         pdf_point = QPoint(int((pos.x() - offset_x) / self.current_scale), 
                           int((pos.y() - offset_y) / self.current_scale))
                           
-        content = self.pdf_handler.get_annotation_content_at_point(self.current_page_index, pdf_point)
+        # Hovering must not wait for a background render; the next mouse move tries again
+        lock = self.pdf_handler.doc_lock
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            content = self.pdf_handler.get_annotation_content_at_point(self.current_page_index, pdf_point)
+        finally:
+            lock.release()
         
         from PyQt6.QtWidgets import QToolTip
         if content:
@@ -831,8 +880,9 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
             if not self.selected_annot or not self.current_pixmap:
                 return
             
-            # Access rect to check if object is still alive
-            r = self.selected_annot.rect
+            # Access rect to check if object is still alive; the only fitz read while painting
+            with self._locked_doc():
+                r = self.selected_annot.rect
         except (ReferenceError, Exception):
             self.selected_annot = None
             return
@@ -849,7 +899,6 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
         offset_x = (self.image_label.width() - (self.current_pixmap.width() if self.current_pixmap else 0)) / 2
         offset_y = (self.image_label.height() - (self.current_pixmap.height() if self.current_pixmap else 0)) / 2
         
-        r = self.selected_annot.rect
         dx, dy = self.drag_displacement_pdf
         
         rect = QRectF((r.x0 + dx) * self.current_scale + offset_x, 
@@ -995,7 +1044,7 @@ class PDFViewer(QScrollArea): # Change to QScrollArea for scrolling large pages
 
     def set_scale(self, scale):
         self.current_scale = max(0.1, min(scale, 10.0))
-        self.update_display()
+        self.update_display(invalidate=False) # Only the scale changed
 
     def zoom_fit(self):
         if not self.current_pixmap: return
@@ -1,8 +1,11 @@
 import os
 import shutil
+import logging
 from xml.etree import ElementTree as ET
 from qt_material import get_theme
 
+logger = logging.getLogger(__name__)
+
 def update_svg_colors(svg_path, theme_name):
     """SVG dosyasındaki renkleri tema rengine göre günceller.
     
@@ -44,13 +47,13 @@ def update_svg_colors(svg_path, theme_name):
             if primary_color:
                 secondary_path.set('style', f"fill: {primary_color};")
             else:
-                print(f"Tema içinde 'primaryColor' bulunamadı: {theme_name}")
+                logger.warning("Tema içinde 'primaryColor' bulunamadı: %s", theme_name)
 
         # Güncellenmiş SVG'yi string olarak döndür
         return ET.tostring(root, encoding='unicode')
 
     except Exception as e:
-        print(f"SVG güncelleme hatası: {e}")
+        logger.error("SVG güncelleme hatası: %s", e)
         return None
 
 def get_themed_icon_path(original_icon_path, theme_name):
@@ -81,17 +84,19 @@ def get_themed_icon_path(original_icon_path, theme_name):
     
     return None
 
-def create_themed_icons(icons_dir):
-    """Tüm temalar için ikon kopyaları oluşturur.
+def create_themed_icons(icons_dir, themes=None):
+    """Tüm temalar (veya yalnızca verilen temalar) için ikon kopyaları oluşturur.
     
     Args:
         icons_dir (str): İkonların bulunduğu dizin
+        themes (list, optional): Oluşturulacak tema adları; None ise tüm temalar
     """
-    # Mevcut temaları al
-    import qt_material
-    qt_material_path = qt_material.__path__[0]
-    themes_dir = os.path.join(qt_material_path, 'themes')
-    themes = [theme.replace('.xml', '') for theme in os.listdir(themes_dir) if theme.endswith('.xml')]
+    if themes is None:
+        # Mevcut temaları al
+        import qt_material
+        qt_material_path = qt_material.__path__[0]
+        themes_dir = os.path.join(qt_material_path, 'themes')
+        themes = [theme.replace('.xml', '') for theme in os.listdir(themes_dir) if theme.endswith('.xml')]
     
     # Her tema için dizin oluştur ve ikonları kopyala
     for theme_name in themes:
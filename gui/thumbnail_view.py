@@ -2,6 +2,8 @@ from PyQt6.QtWidgets import QListWidget, QListView, QListWidgetItem, QAbstractIt
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtCore import QSize, Qt, pyqtSignal
 
+_THUMB_SCALE = 0.2  # Render scale used for thumbnails
+
 class ThumbnailView(QListWidget):
     """
     A widget to display thumbnails of PDF pages, with drag-and-drop reordering.
@@ -42,13 +44,27 @@ class ThumbnailView(QListWidget):
 
     def add_thumbnail(self, pixmap: QPixmap, page_num: int):
         """
-        Adds a thumbnail to the view.
+        Adds a thumbnail to the view. Pages whose pixmap could not be rendered
+        still get a text-only item, so that rows always match page numbers.
         """
+        self.addItem(self._make_item(pixmap, page_num))
+
+    def _make_item(self, pixmap: QPixmap, page_num: int):
+        item = QListWidgetItem(f"Page {page_num + 1}")
         if not pixmap.isNull():
-            item = QListWidgetItem(QIcon(pixmap), f"Page {page_num + 1}")
-            item.setData(Qt.ItemDataRole.UserRole, page_num)
-            item.setSizeHint(self.iconSize())
-            self.addItem(item)
+            item.setIcon(QIcon(pixmap))
+        item.setData(Qt.ItemDataRole.UserRole, page_num)
+        item.setSizeHint(self.iconSize())
+        return item
+
+    def _renumber_from(self, row: int):
+        """
+        Updates the labels and stored page numbers of all items from row on.
+        """
+        for r in range(row, self.count()):
+            item = self.item(r)
+            item.setText(f"Page {r + 1}")
+            item.setData(Qt.ItemDataRole.UserRole, r)
 
     def clear_thumbnails(self):
         """
@@ -56,6 +72,12 @@ class ThumbnailView(QListWidget):
         """
         self.clear()
 
+    def item_for_page(self, page_num: int):
+        """
+        Returns the thumbnail item for page_num, or None if it is out of range.
+        """
+        return self.item(page_num)
+
     def update_thumbnails(self, pdf_handler):
         """
         Updates the thumbnails based on the current PDF document.
@@ -64,7 +86,32 @@ class ThumbnailView(QListWidget):
         if pdf_handler and pdf_handler.doc:
             for page_num in range(pdf_handler.page_count):
                 # Use a smaller scale for thumbnails
-                pixmap = pdf_handler.get_page_pixmap(page_num, scale=0.2)
-                if pixmap:
-                    self.add_thumbnail(pixmap, page_num)
+                pixmap = pdf_handler.get_page_pixmap(page_num, scale=_THUMB_SCALE, use_cache=False)
+                self.add_thumbnail(pixmap or QPixmap(), page_num)
 
+    def refresh_page(self, pdf_handler, page_num: int):
+        """
+        Re-renders the thumbnail of a single page, reusing its existing item.
+        """
+        item = self.item_for_page(page_num)
+        if item is None or not pdf_handler or not pdf_handler.doc:
+            return
+        pixmap = pdf_handler.get_page_pixmap(page_num, scale=_THUMB_SCALE, use_cache=False)
+        if pixmap and not pixmap.isNull():
+            item.setIcon(QIcon(pixmap))
+
+    def insert_page(self, pdf_handler, page_num: int):
+        """
+        Adds the thumbnail of a newly inserted page without re-rendering the others.
+        """
+        pixmap = pdf_handler.get_page_pixmap(page_num, scale=_THUMB_SCALE, use_cache=False)
+        self.insertItem(page_num, self._make_item(pixmap or QPixmap(), page_num))
+        self._renumber_from(page_num + 1)
+
+    def remove_page(self, page_num: int):
+        """
+        Removes the thumbnail of a deleted page and renumbers the ones after it.
+        """
+        if 0 <= page_num < self.count():
+            self.takeItem(page_num)
+            self._renumber_from(page_num)
@@ -1,9 +1,12 @@
 import os
+import logging
 from PyQt6.QtWidgets import QToolBar, QPushButton, QWidget, QVBoxLayout, QComboBox, QFileDialog
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtCore import Qt, QSize
 from gui.svg_utils import get_icon_for_theme
 
+logger = logging.getLogger(__name__)
+
 class ToolbarManager:
     """Manages the toolbars for the MantiPDF Editor."""
 
@@ -13,6 +16,19 @@ class ToolbarManager:
         self.toolbars = {}
         # Buton ikonlarını ve isimlerini saklayacak sözlük
         self.button_icons = {}
+        # (tema, ikon adı) -> QIcon; yalnızca geçerli temanın ikonları tutulur
+        self._icon_cache: dict[tuple[str, str], QIcon] = {}
+
+    def themed_icon(self, icon_name, theme_name=None):
+        """Returns the QIcon of icon_name for theme_name (default: the current theme), loading it once."""
+        theme_name = theme_name or self.main_window.current_theme
+        key = (theme_name, icon_name)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
+            icon = QIcon(get_icon_for_theme(f"{icon_name}.svg", theme_name, icons_dir))
+            self._icon_cache[key] = icon
+        return icon
 
     def create_toolbar(self, name):
         """Create a toolbar with the given name."""
@@ -37,11 +53,8 @@ class ToolbarManager:
             button.setCheckable(True)
             
         if icon_name:
-            # Tema bazlı ikon yolunu al
-            icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
-            current_theme = self.main_window.current_theme
-            icon_path = get_icon_for_theme(f"{icon_name}.svg", current_theme, icons_dir)
-            button.setIcon(QIcon(icon_path))
+            # Tema bazlı ikonu al
+            button.setIcon(self.themed_icon(icon_name))
             # İkon boyutunu ayarla (32x32 piksel)
             button.setIconSize(QSize(26, 26))
             # Butonun minimum boyutunu ayarla
@@ -77,22 +90,20 @@ class ToolbarManager:
     def update_button_icons(self, theme_name):
         """Toolbar butonlarının ikonlarını belirtilen temaya göre günceller."""
         try:
-            print(f"Toolbar butonlarının ikonları '{theme_name}' temasına göre güncelleniyor...")
-            icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
+            logger.debug("Toolbar butonlarının ikonları '%s' temasına göre güncelleniyor...", theme_name)
+            # Önceki temanın ikonlarını önbellekten at
+            self._icon_cache = {key: icon for key, icon in self._icon_cache.items() if key[0] == theme_name}
             
             # Saklanan buton ve ikon adlarını kullanarak ikonları güncelle
             for button, icon_name in self.button_icons.items():
-                icon_path = get_icon_for_theme(f"{icon_name}.svg", theme_name, icons_dir)
-                button.setIcon(QIcon(icon_path))
+                button.setIcon(self.themed_icon(icon_name, theme_name))
                 # İkon boyutunu korumak için tekrar ayarla
                 button.setIconSize(QSize(26, 26))
-                print(f"'{button.text()}' butonu için ikon güncellendi: {icon_path}")
+                logger.debug("'%s' butonu için ikon güncellendi: %s", button.toolTip(), icon_name)
                 
-            print("Toolbar butonlarının ikonları güncellendi.")
-        except Exception as e:
-            print(f"Toolbar butonlarının ikonları güncellenirken hata oluştu: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Toolbar butonlarının ikonları güncellendi.")
+        except Exception:
+            logger.exception("Toolbar butonlarının ikonları güncellenirken hata oluştu")
 
     def add_action(self, toolbar, action):
         """Add an action to the toolbar."""
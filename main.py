@@ -1,16 +1,21 @@
 import sys
 import os # Import os
+import logging
+import multiprocessing
 from PyQt6.QtWidgets import QApplication, QSplashScreen
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import QSettings, QTimer
-import qt_material # Import qt_material to get its path
-from qt_material import apply_stylesheet, set_icons_theme, get_theme
 
 # Import the main window class
-from gui.main_window import MainWindow
+from gui.main_window import MainWindow, apply_theme_stylesheet
+
+logger = logging.getLogger(__name__)
 
 def main():
     """Main function to run the MantiPDF application."""
+    # Configure logging once for the whole application
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
     app = QApplication(sys.argv)
 
     # Show splash screen
@@ -27,29 +32,13 @@ def main():
     settings = QSettings("MantiPDF", "Editor")
     initial_theme = settings.value("theme", "dark_teal")
     try:
-        # Construct full path to the theme file
-        qt_material_path = qt_material.__path__[0]
-        theme_file_path = os.path.join(qt_material_path, 'themes', f"{initial_theme}.xml")
-
-        if os.path.exists(theme_file_path):
-            import logging
-            logging.getLogger().setLevel(logging.ERROR)
-            
-            apply_stylesheet(app, theme=theme_file_path) # Pass full path
-            
-            # Fetch theme data to check for extra settings
-            theme_data = get_theme(initial_theme)
-            if theme_data and 'icon_theme' in theme_data:
-                set_icons_theme(theme_data['icon_theme'])
-            
-            logging.getLogger().setLevel(logging.WARNING)
-        else:
-             print(f"ERROR: Initial theme file not found at {theme_file_path}")
-
-    except Exception as e:
-        print(f"ERROR applying initial theme {initial_theme} in main.py: {e}")
-        import traceback
-        traceback.print_exc() # Print full traceback for detailed error info
+        logging.getLogger().setLevel(logging.ERROR)
+        # Uses the stylesheet cached by an earlier run when there is one
+        apply_theme_stylesheet(app, initial_theme)
+    except Exception:
+        logger.exception("Error applying initial theme %s", initial_theme)
+    finally:
+        logging.getLogger().setLevel(logging.WARNING)
 
     # Create the main window
     window = MainWindow(app) # Pass the themed app instance
@@ -67,4 +56,5 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support() # Lets split worker processes start from the frozen (PyInstaller) build
     main()